@@ -5,7 +5,10 @@ This module defines liquid class parameters for different pipettes and liquids,
 based on reference data for optimal liquid handling performance.
 """
 
-from typing import Dict, Any, Optional
+import csv
+import io
+import itertools
+from typing import Dict, Any, List, Optional
 from dataclasses import dataclass
 from enum import Enum
 
@@ -35,6 +38,38 @@ class LiquidType(Enum):
     ETHANOL = "Ethanol"
 
 
+# Enum members by value, so CSV rows resolve with a dict lookup instead of the
+# Enum constructor
+_PIPETTES_BY_VALUE: Dict[str, PipetteType] = {pipette.value: pipette for pipette in PipetteType}
+_LIQUIDS_BY_VALUE: Dict[str, LiquidType] = {liquid.value: liquid for liquid in LiquidType}
+
+# Numeric CSV columns as (LiquidClassParams field, column index)
+_CSV_FLOAT_FIELDS = (
+    ("aspiration_rate", 2),
+    ("aspiration_delay", 3),
+    ("aspiration_withdrawal_rate", 4),
+    ("dispense_rate", 5),
+    ("dispense_delay", 6),
+    ("blowout_rate", 7),
+)
+
+
+# CSV header, with no spaces after commas for compatibility
+_CSV_HEADER = (
+    "Pipette,Liquid,Aspiration Rate (µL/s),Aspiration Delay (s),"
+    "Aspiration Withdrawal Rate (mm/s),Dispense Rate (µL/s),"
+    "Dispense Delay (s),Blowout Rate (µL/s),Touch tip"
+)
+
+
+class _CustomLiquid:
+    """Stand-in for a LiquidType member when a CSV row names an unknown liquid"""
+
+    def __init__(self, name):
+        self.value = name
+        self.name = name.upper().replace(" ", "_").replace("%", "PCT")
+
+
 @dataclass
 class LiquidClassParams:
     """Liquid class parameters for a specific pipette-liquid combination"""
@@ -73,9 +108,13 @@ class LiquidClassParams:
 class LiquidClassRegistry:
     """Registry for liquid class parameters"""
 
-    def __init__(self):
+    def __init__(self, liquid_classes: Optional[Dict[str, LiquidClassParams]] = None):
+        """Create a registry holding the default liquid classes, or a copy of liquid_classes"""
         self._liquid_classes: Dict[str, LiquidClassParams] = {}
-        self._initialize_default_classes()
+        if liquid_classes is None:
+            self._initialize_default_classes()
+        else:
+            self._liquid_classes.update(liquid_classes)
 
     def _initialize_default_classes(self):
         """Initialize with default liquid class parameters"""
@@ -347,86 +386,77 @@ class LiquidClassRegistry:
         key = f"{pipette.value}_{liquid.value}"
         return self._liquid_classes.get(key)
 
+    def copy(self) -> "LiquidClassRegistry":
+        """Return an independent registry holding the same liquid classes"""
+        return LiquidClassRegistry(self._liquid_classes)
+
     def list_liquid_classes(self) -> Dict[str, LiquidClassParams]:
         """List all available liquid classes"""
         return self._liquid_classes.copy()
 
     def export_csv(self) -> str:
         """Export all liquid classes to CSV format"""
-        # Use header with no spaces after commas for compatibility
-        header = (
-            "Pipette,Liquid,Aspiration Rate (µL/s),Aspiration Delay (s),"
-            "Aspiration Withdrawal Rate (mm/s),Dispense Rate (µL/s),"
-            "Dispense Delay (s),Blowout Rate (µL/s),Touch tip"
+        # Same fields as str(liquid_class); csv.writer quotes custom liquid names that
+        # contain commas or quotes, so the export always reads back with import_from_csv
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+        writer.writerow(_CSV_HEADER.split(","))
+        writer.writerows(
+            (
+                lc.pipette.value,
+                lc.liquid.value,
+                lc.aspiration_rate,
+                lc.aspiration_delay,
+                lc.aspiration_withdrawal_rate,
+                lc.dispense_rate,
+                lc.dispense_delay,
+                lc.blowout_rate,
+                "Yes" if lc.touch_tip else "No",
+            )
+            for lc in self._liquid_classes.values()
         )
-        rows = [header]
-
-        for liquid_class in self._liquid_classes.values():
-            # Export with no extra spaces after commas
-            row = str(liquid_class)
-            row = ",".join([field.strip() for field in row.split(",")])
-            rows.append(row)
-
-        return "\n".join(rows)
+        return buffer.getvalue().rstrip("\n")
 
     def import_from_csv(self, csv_data: str):
         """Import liquid classes from CSV data"""
-        lines = csv_data.strip().split("\n")
-        if len(lines) < 2:
+        # skipinitialspace drops the blanks after commas that hand-written CSVs often have
+        reader = csv.reader(io.StringIO(csv_data.strip()), skipinitialspace=True)
+        header = next(reader, None)
+        first_row = next(reader, None)
+        if header is None or first_row is None:
             raise ValueError("CSV must have at least a header and one data row")
 
         # Accept both header formats (with or without spaces after commas)
-        header_no_space = (
-            "Pipette,Liquid,Aspiration Rate (µL/s),Aspiration Delay (s),"
-            "Aspiration Withdrawal Rate (mm/s),Dispense Rate (µL/s),"
-            "Dispense Delay (s),Blowout Rate (µL/s),Touch tip"
-        )
-        header = lines[0].replace(" ", "")
-        if header != header_no_space.replace(" ", ""):
+        if ",".join(header).replace(" ", "") != _CSV_HEADER.replace(" ", ""):
             raise ValueError("CSV header does not match expected format")
 
-        # Skip header
-        for line in lines[1:]:
-            if line.strip():
-                self._parse_csv_line(line)
+        for row in itertools.chain((first_row,), reader):
+            if any(field.strip() for field in row):
+                self._parse_csv_row(row)
 
-    def _parse_csv_line(self, line: str):
-        """Parse a single CSV line into a LiquidClassParams object"""
-        # Strip whitespace from all fields
-        parts = [p.strip() for p in line.split(",")]
+    def _parse_csv_row(self, row: List[str]):
+        """Parse a single CSV row into a LiquidClassParams object"""
+        line = ",".join(row)
+        # Leading blanks are already skipped by the reader; drop trailing ones too
+        parts = [field.strip() for field in row]
         if len(parts) != 9:
             raise ValueError(f"Invalid CSV line format: {line}")
 
         try:
-            pipette = PipetteType(parts[0])
-            try:
-                liquid: Any = LiquidType(parts[1])
-            except ValueError:
+            pipette = _PIPETTES_BY_VALUE.get(parts[0])
+            if pipette is None:
+                raise ValueError(f"{parts[0]!r} is not a valid PipetteType")
+            liquid: Any = _LIQUIDS_BY_VALUE.get(parts[1])
+            if liquid is None:
                 # Allow custom liquids
-                class CustomLiquid:
-                    def __init__(self, name):
-                        self.value = name
-                        self.name = name.upper().replace(" ", "_").replace("%", "PCT")
-
-                liquid = CustomLiquid(parts[1])
-            aspiration_rate = float(parts[2])
-            aspiration_delay = float(parts[3])
-            aspiration_withdrawal_rate = float(parts[4])
-            dispense_rate = float(parts[5])
-            dispense_delay = float(parts[6])
-            blowout_rate = float(parts[7])
-            touch_tip = parts[8].lower() == "yes"
+                liquid = _CustomLiquid(parts[1])
+            values = {field: float(parts[index]) for field, index in _CSV_FLOAT_FIELDS}
 
             liquid_class = LiquidClassParams(
                 pipette=pipette,
                 liquid=liquid,
-                aspiration_rate=aspiration_rate,
-                aspiration_delay=aspiration_delay,
-                aspiration_withdrawal_rate=aspiration_withdrawal_rate,
-                dispense_rate=dispense_rate,
-                dispense_delay=dispense_delay,
-                blowout_rate=blowout_rate,
-                touch_tip=touch_tip,
+                touch_tip=parts[8].lower() == "yes",
+                **values,
             )
 
             self.add_liquid_class(liquid_class)
@@ -435,32 +465,43 @@ class LiquidClassRegistry:
             raise ValueError(f"Error parsing CSV line '{line}': {e}")
 
 
-# Global registry instance
+# Global registry instance, used by the convenience functions below unless
+# they are given another registry
 liquid_class_registry = LiquidClassRegistry()
 
 
 def get_liquid_class_params(
-    pipette: PipetteType, liquid: LiquidType
+    pipette: PipetteType,
+    liquid: LiquidType,
+    registry: LiquidClassRegistry = liquid_class_registry,
 ) -> Optional[LiquidClassParams]:
     """Convenience function to get liquid class parameters"""
-    return liquid_class_registry.get_liquid_class(pipette, liquid)
+    return registry.get_liquid_class(pipette, liquid)
 
 
-def add_liquid_class_params(liquid_class: LiquidClassParams):
+def add_liquid_class_params(
+    liquid_class: LiquidClassParams, registry: LiquidClassRegistry = liquid_class_registry
+):
     """Convenience function to add liquid class parameters"""
-    liquid_class_registry.add_liquid_class(liquid_class)
+    registry.add_liquid_class(liquid_class)
 
 
-def remove_liquid_class_params(pipette: PipetteType, liquid: LiquidType) -> bool:
+def remove_liquid_class_params(
+    pipette: PipetteType,
+    liquid: LiquidType,
+    registry: LiquidClassRegistry = liquid_class_registry,
+) -> bool:
     """Convenience function to remove liquid class parameters"""
-    return liquid_class_registry.remove_liquid_class(pipette, liquid)
+    return registry.remove_liquid_class(pipette, liquid)
 
 
-def export_liquid_classes_csv() -> str:
+def export_liquid_classes_csv(registry: LiquidClassRegistry = liquid_class_registry) -> str:
     """Convenience function to export all liquid classes to CSV"""
-    return liquid_class_registry.export_csv()
+    return registry.export_csv()
 
 
-def import_liquid_classes_from_csv(csv_data: str):
+def import_liquid_classes_from_csv(
+    csv_data: str, registry: LiquidClassRegistry = liquid_class_registry
+):
     """Convenience function to import liquid classes from CSV"""
-    liquid_class_registry.import_from_csv(csv_data)
+    registry.import_from_csv(csv_data)
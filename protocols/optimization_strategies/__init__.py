@@ -6,7 +6,7 @@ used in liquid class calibration protocols. Each strategy implements the same in
 but uses different approaches to parameter optimization.
 """
 
-from .base import OptimizationStrategy
+from .base import HistoryRecord, OptimizationStrategy, WellData, WellResult
 from .simultaneous import SimultaneousOptimizationStrategy
 from .hybrid import HybridOptimizationStrategy
 from .coordinate_descent import CoordinateDescentOptimizationStrategy
@@ -14,6 +14,9 @@ from .factory import OptimizationStrategyFactory
 
 __all__ = [
     "OptimizationStrategy",
+    "WellResult",
+    "WellData",
+    "HistoryRecord",
     "SimultaneousOptimizationStrategy",
     "HybridOptimizationStrategy",
     "CoordinateDescentOptimizationStrategy",
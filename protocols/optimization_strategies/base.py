@@ -5,8 +5,105 @@ This module contains the abstract base class for all optimization strategies
 used in liquid class calibration protocols.
 """
 
+import math
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Tuple
+from types import MappingProxyType
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+# Flow rate bounds for different pipette types
+_PIPETTE_RATE_BOUNDS: Dict[str, Dict[str, Tuple[float, float]]] = {
+    "P20": {
+        "aspiration_rate": (1.0, 20.0),  # 1-20 μL/sec
+        "dispense_rate": (1.0, 20.0),  # 1-20 μL/sec
+        "blowout_rate": (0.5, 10.0),  # 0.5-10 μL/sec
+        "aspiration_withdrawal_rate": (0.5, 5.0),  # 0.5-5 μL/sec
+    },
+    "P50": {
+        "aspiration_rate": (2.0, 50.0),  # 2-50 μL/sec
+        "dispense_rate": (2.0, 50.0),  # 2-50 μL/sec
+        "blowout_rate": (1.0, 20.0),  # 1-20 μL/sec
+        "aspiration_withdrawal_rate": (1.0, 10.0),  # 1-10 μL/sec
+    },
+    "P300": {
+        "aspiration_rate": (5.0, 150.0),  # 5-150 μL/sec
+        "dispense_rate": (5.0, 150.0),  # 5-150 μL/sec
+        "blowout_rate": (2.0, 50.0),  # 2-50 μL/sec
+        "aspiration_withdrawal_rate": (1.0, 15.0),  # 1-15 μL/sec
+    },
+    "P1000": {
+        "aspiration_rate": (10.0, 300.0),  # 10-300 μL/sec
+        "dispense_rate": (10.0, 300.0),  # 10-300 μL/sec
+        "blowout_rate": (5.0, 150.0),  # 5-150 μL/sec
+        "aspiration_withdrawal_rate": (2.0, 25.0),  # 2-25 μL/sec
+    },
+}
+
+# Delay bounds (same for all pipettes, but liquid-dependent)
+_DELAY_BOUNDS: Dict[str, Tuple[float, float]] = {
+    "VOLATILE": (0.0, 1.0),  # Volatile liquids need shorter delays (0-1 seconds)
+    "VISCOUS": (0.0, 3.0),  # Viscous liquids can benefit from longer delays (0-3 seconds)
+    "STANDARD": (0.0, 2.0),  # Standard delays for most liquids (0-2 seconds)
+}
+
+_LIQUID_DELAY_CLASS: Dict[str, str] = {
+    "DMSO": "VOLATILE",
+    "ETHANOL": "VOLATILE",
+    "GLYCEROL_99": "VISCOUS",
+    "PEG_8000_50": "VISCOUS",
+    "ENGINE_OIL_100": "VISCOUS",
+}
+
+# Complete bounds for every (pipette, liquid class) combination, built once at import
+_BOUNDS_TABLE: Dict[Tuple[str, str], Dict[str, Tuple[float, float]]] = {
+    (pipette, liquid_class): {
+        **rate_bounds,
+        "aspiration_delay": delay_bounds,
+        "dispense_delay": delay_bounds,
+    }
+    for pipette, rate_bounds in _PIPETTE_RATE_BOUNDS.items()
+    for liquid_class, delay_bounds in _DELAY_BOUNDS.items()
+}
+
+_UNBOUNDED = (float("-inf"), float("inf"))
+
+
+class WellResult(NamedTuple):
+    """Result of dispensing and evaluating a single well"""
+
+    well_id: str
+    well_index: int
+    parameters: Dict[str, Any]
+    height_status: bool
+    bubblicity_score: float
+    phase: Optional[str] = None
+
+
+# Well results as passed to generate_parameters; plain dicts are still accepted
+WellData = Sequence[Union[WellResult, Mapping[str, Any]]]
+
+
+class HistoryRecord(NamedTuple):
+    """Compact optimization history entry recorded by a strategy for each well"""
+
+    iteration: int
+    parameters: Mapping[str, float]
+    score: float
+    height_status: bool
+    learning_rate: float
+    best_score: float
+    phase: Optional[str] = None
 
 
 class OptimizationStrategy(ABC):
@@ -24,9 +121,17 @@ class OptimizationStrategy(ABC):
         """
         self.reference_params = reference_params
         self.param_bounds = param_bounds
-        self.optimization_history: List[Dict[str, Any]] = []
+        self.optimization_history: List[HistoryRecord] = []
         self.best_score = float("inf")
-        self.best_params = reference_params.copy()
+        self.best_params: Mapping[str, float] = reference_params.copy()
+
+        # Running sum of squared gradients per parameter, for _adaptive_step
+        self._grad_sq_sum: Dict[str, float] = {}
+
+    @property
+    def history(self) -> Iterator[Dict[str, Any]]:
+        """Optimization history as dicts, one per recorded well"""
+        return (record._asdict() for record in self.optimization_history)
 
     @staticmethod
     def calculate_pipette_specific_bounds(
@@ -42,68 +147,12 @@ class OptimizationStrategy(ABC):
         Returns:
             Dictionary of parameter bounds (min, max) for each parameter
         """
-        # Base bounds for different pipette types
-        pipette_bounds = {
-            "P20": {
-                "aspiration_rate": (1.0, 20.0),  # 1-20 μL/sec
-                "dispense_rate": (1.0, 20.0),  # 1-20 μL/sec
-                "blowout_rate": (0.5, 10.0),  # 0.5-10 μL/sec
-                "aspiration_withdrawal_rate": (0.5, 5.0),  # 0.5-5 μL/sec
-            },
-            "P50": {
-                "aspiration_rate": (2.0, 50.0),  # 2-50 μL/sec
-                "dispense_rate": (2.0, 50.0),  # 2-50 μL/sec
-                "blowout_rate": (1.0, 20.0),  # 1-20 μL/sec
-                "aspiration_withdrawal_rate": (1.0, 10.0),  # 1-10 μL/sec
-            },
-            "P300": {
-                "aspiration_rate": (5.0, 150.0),  # 5-150 μL/sec
-                "dispense_rate": (5.0, 150.0),  # 5-150 μL/sec
-                "blowout_rate": (2.0, 50.0),  # 2-50 μL/sec
-                "aspiration_withdrawal_rate": (1.0, 15.0),  # 1-15 μL/sec
-            },
-            "P1000": {
-                "aspiration_rate": (10.0, 300.0),  # 10-300 μL/sec
-                "dispense_rate": (10.0, 300.0),  # 10-300 μL/sec
-                "blowout_rate": (5.0, 150.0),  # 5-150 μL/sec
-                "aspiration_withdrawal_rate": (2.0, 25.0),  # 2-25 μL/sec
-            },
-        }
-
-        # Get base bounds for pipette type
-        if pipette_type not in pipette_bounds:
+        if pipette_type not in _PIPETTE_RATE_BOUNDS:
             # Default to P1000 if unknown
             pipette_type = "P1000"
 
-        bounds = pipette_bounds[pipette_type].copy()
-
-        # Add delay bounds (same for all pipettes, but liquid-dependent)
-        if liquid_type in ["DMSO", "ETHANOL"]:
-            # Volatile liquids need shorter delays
-            bounds.update(
-                {
-                    "aspiration_delay": (0.0, 1.0),  # 0-1 seconds
-                    "dispense_delay": (0.0, 1.0),  # 0-1 seconds
-                }
-            )
-        elif liquid_type in ["GLYCEROL_99", "PEG_8000_50", "ENGINE_OIL_100"]:
-            # Viscous liquids can benefit from longer delays
-            bounds.update(
-                {
-                    "aspiration_delay": (0.0, 3.0),  # 0-3 seconds
-                    "dispense_delay": (0.0, 3.0),  # 0-3 seconds
-                }
-            )
-        else:
-            # Standard delays for most liquids
-            bounds.update(
-                {
-                    "aspiration_delay": (0.0, 2.0),  # 0-2 seconds
-                    "dispense_delay": (0.0, 2.0),  # 0-2 seconds
-                }
-            )
-
-        return bounds
+        liquid_class = _LIQUID_DELAY_CLASS.get(liquid_type, "STANDARD")
+        return dict(_BOUNDS_TABLE[(pipette_type, liquid_class)])
 
     @staticmethod
     def get_default_bounds() -> Dict[str, Tuple[float, float]]:
@@ -122,16 +171,39 @@ class OptimizationStrategy(ABC):
             "blowout_rate": (5.0, 150.0),
         }
 
+    @staticmethod
+    def as_well_result(row: Union[WellResult, Mapping[str, Any]]) -> WellResult:
+        """
+        Normalize a previous well result to a WellResult tuple
+
+        Args:
+            row: WellResult tuple, or dict with at least "parameters" and
+                "bubblicity_score" (other keys are optional, extra keys are ignored)
+
+        Returns:
+            WellResult tuple
+        """
+        if isinstance(row, WellResult):
+            return row
+        return WellResult(
+            well_id=row.get("well_id", ""),
+            well_index=row.get("well_index", -1),
+            parameters=row["parameters"],
+            height_status=row.get("height_status", False),
+            bubblicity_score=row["bubblicity_score"],
+            phase=row.get("phase"),
+        )
+
     @abstractmethod
     def generate_parameters(
-        self, well_idx: int, well_data: List[Dict[str, Any]], learning_rate: float
+        self, well_idx: int, well_data: WellData, learning_rate: float
     ) -> Dict[str, float]:
         """
         Generate parameters for the next well
 
         Args:
             well_idx: Current well index (0-based)
-            well_data: List of previous well results
+            well_data: List of previous well results (WellResult tuples or dicts)
             learning_rate: Current learning rate
 
         Returns:
@@ -151,12 +223,71 @@ class OptimizationStrategy(ABC):
 
     def apply_constraints(self, params: Dict[str, float]) -> Dict[str, float]:
         """Apply parameter constraints to keep values within bounds"""
-        constrained_params = params.copy()
-        for param, (min_val, max_val) in self.param_bounds.items():
-            if param in constrained_params:
-                constrained_params[param] = max(min_val, min(max_val, constrained_params[param]))
+        # Single pass over params; unbounded entries (e.g. touch_tip) clip to themselves
+        bounds = self.param_bounds
+        constrained_params = {}
+        for param, value in params.items():
+            min_val, max_val = bounds.get(param, _UNBOUNDED)
+            constrained_params[param] = max(min_val, min(max_val, value))
         return constrained_params
 
+    @staticmethod
+    def _finite_difference_gradients(
+        params: Iterable[str],
+        previous_score: float,
+        current_score: float,
+        previous_params: Mapping[str, float],
+        current_params: Mapping[str, float],
+    ) -> Dict[str, float]:
+        """
+        Estimate per-parameter gradients from two consecutive well results
+
+        Args:
+            params: Parameters to estimate gradients for
+            previous_score: Score of the earlier well
+            current_score: Score of the later well
+            previous_params: Parameters of the earlier well
+            current_params: Parameters of the later well
+
+        Returns:
+            Dictionary of gradients, 0.0 where none can be estimated
+        """
+        # An infinite (or NaN) previous score marks a missing previous result
+        if not math.isfinite(previous_score):
+            return {param: 0.0 for param in params}
+
+        gradients = {}
+        for param in params:
+            if param in previous_params and param in current_params:
+                param_change = current_params[param] - previous_params[param]
+                if abs(param_change) > 1e-6:  # Avoid division by zero
+                    score_change = current_score - previous_score
+                    gradients[param] = -score_change / param_change
+                else:
+                    gradients[param] = 0.0
+            else:
+                gradients[param] = 0.0
+
+        return gradients
+
+    def _adaptive_step(self, param: str, gradient: float, step_size: float) -> float:
+        """
+        Scale a parameter's step size AdaGrad-style
+
+        Shrinks the step for parameters with a history of large gradients.
+
+        Args:
+            param: Parameter name
+            gradient: Gradient for this update
+            step_size: Base step size for the parameter
+
+        Returns:
+            Scaled step size
+        """
+        grad_sq_sum = self._grad_sq_sum.get(param, 0.0) + gradient * gradient
+        self._grad_sq_sum[param] = grad_sq_sum
+        return step_size / (math.sqrt(grad_sq_sum) + 1e-8)
+
     def record_result(
         self,
         well_idx: int,
@@ -165,18 +296,25 @@ class OptimizationStrategy(ABC):
         height_status: bool,
         learning_rate: float,
     ):
-        """Record optimization result for history tracking"""
+        """
+        Record optimization result for history tracking
+
+        The parameters dict is stored as a read-only view rather than copied, so
+        callers must not mutate it after recording (generate_parameters always
+        returns a fresh dict per well).
+        """
+        snapshot = MappingProxyType(parameters)
         self.optimization_history.append(
-            {
-                "iteration": well_idx,
-                "parameters": parameters.copy(),
-                "score": score,
-                "height_status": height_status,
-                "learning_rate": learning_rate,
-                "best_score": self.best_score,
-            }
+            HistoryRecord(
+                iteration=well_idx,
+                parameters=snapshot,
+                score=score,
+                height_status=height_status,
+                learning_rate=learning_rate,
+                best_score=self.best_score,
+            )
         )
 
         if height_status and score < self.best_score:
             self.best_score = score
-            self.best_params = parameters.copy()
+            self.best_params = snapshot
@@ -2,18 +2,23 @@
 Coordinate Descent Optimization Strategy
 
 This module contains the CoordinateDescentOptimizationStrategy class that optimizes
-one parameter at a time in cycling order.
+one parameter at a time, either in cycling order or by uniform random selection.
 """
 
-from typing import List, Dict, Any, Tuple
-from .base import OptimizationStrategy
+import random
+from typing import Callable, Dict, Optional, Tuple
+from .base import OptimizationStrategy, WellData, WellResult
 
 
 class CoordinateDescentOptimizationStrategy(OptimizationStrategy):
     """Coordinate descent optimization - optimize one parameter at a time"""
 
     def __init__(
-        self, reference_params: Dict[str, float], param_bounds: Dict[str, Tuple[float, float]]
+        self,
+        reference_params: Dict[str, float],
+        param_bounds: Dict[str, Tuple[float, float]],
+        random_selection: bool = False,
+        seed: Optional[int] = None,
     ):
         super().__init__(reference_params, param_bounds)
 
@@ -40,14 +45,48 @@ class CoordinateDescentOptimizationStrategy(OptimizationStrategy):
         self.current_param_index = 0
         self.param_cycle_count = 0
 
+        # Randomized coordinate selection: sample coordinates uniformly, since the
+        # step sizes are in each parameter's own units and are not comparable.
+        # A seed keeps protocol runs reproducible.
+        self.random_selection = random_selection
+        self._rng = random.Random(seed)
+        self._coordinate_switches = 0
+
+        # One specialized update closure per coordinate, indexed like param_order
+        self._updaters = [self._make_updater(name) for name in self.param_order]
+
+    def _make_updater(
+        self, name: str
+    ) -> Callable[[WellResult, WellResult, float], Dict[str, float]]:
+        """Build the gradient update for a single coordinate with its step size bound"""
+        step_size = self.step_sizes[name]
+
+        def update(
+            last_result: WellResult, second_last_result: WellResult, learning_rate: float
+        ) -> Dict[str, float]:
+            current_params = last_result.parameters.copy()
+            if name in current_params:
+                value = current_params[name]
+                param_change = value - second_last_result.parameters[name]
+                if abs(param_change) > 1e-6:
+                    score_change = (
+                        last_result.bubblicity_score - second_last_result.bubblicity_score
+                    )
+                    gradient = -score_change / param_change
+                    current_params[name] = value + learning_rate * step_size * gradient
+            return current_params
+
+        return update
+
     def get_strategy_name(self) -> str:
         return "Coordinate Descent"
 
     def get_strategy_description(self) -> str:
-        return "Optimizes one parameter at a time in cycling order"
+        order = "random order" if self.random_selection else "cycling order"
+        return f"Optimizes one parameter at a time in {order}"
 
     def generate_parameters(
-        self, well_idx: int, well_data: List[Dict[str, Any]], learning_rate: float
+        self, well_idx: int, well_data: WellData, learning_rate: float
     ) -> Dict[str, float]:
         """Generate parameters using coordinate descent"""
 
@@ -69,25 +108,13 @@ class CoordinateDescentOptimizationStrategy(OptimizationStrategy):
         else:
             # Coordinate descent optimization
             if len(well_data) >= 2:
-                last_result = well_data[-1]
-                second_last_result = well_data[-2]
-
                 # Only optimize the current parameter
-                current_params = last_result["parameters"].copy()
-
-                if current_param in current_params:
-                    param_change = (
-                        current_params[current_param]
-                        - second_last_result["parameters"][current_param]
-                    )
-                    if abs(param_change) > 1e-6:
-                        score_change = (
-                            last_result["bubblicity_score"] - second_last_result["bubblicity_score"]
-                        )
-                        gradient = -score_change / param_change
-                        step = learning_rate * self.step_sizes[current_param] * gradient
-                        current_params[current_param] += step
-
+                update = self._updaters[self.current_param_index]
+                current_params = update(
+                    self.as_well_result(well_data[-1]),
+                    self.as_well_result(well_data[-2]),
+                    learning_rate,
+                )
                 return self.apply_constraints(current_params)
             else:
                 return self.reference_params.copy()
@@ -105,6 +132,12 @@ class CoordinateDescentOptimizationStrategy(OptimizationStrategy):
 
         # Advance to next parameter every few wells (parameter cycling)
         if well_idx > 0 and well_idx % 3 == 0:  # Change parameter every 3 wells
-            self.current_param_index = (self.current_param_index + 1) % len(self.param_order)
-            if self.current_param_index == 0:
-                self.param_cycle_count += 1
+            if self.random_selection:
+                self.current_param_index = self._rng.randrange(len(self.param_order))
+                # Count a "cycle" per len(param_order) switches to keep the stat comparable
+                self._coordinate_switches += 1
+                self.param_cycle_count = self._coordinate_switches // len(self.param_order)
+            else:
+                self.current_param_index = (self.current_param_index + 1) % len(self.param_order)
+                if self.current_param_index == 0:
+                    self.param_cycle_count += 1
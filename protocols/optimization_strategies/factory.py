@@ -5,7 +5,7 @@ This module contains the OptimizationStrategyFactory class that creates
 optimization strategy instances by name.
 """
 
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Tuple
 from .base import OptimizationStrategy
 from .simultaneous import SimultaneousOptimizationStrategy
 from .hybrid import HybridOptimizationStrategy
@@ -21,6 +21,9 @@ class OptimizationStrategyFactory:
         reference_params: Dict[str, float],
         param_bounds: Dict[str, Tuple[float, float]],
         sample_count: int = 96,
+        adaptive_learning_rate: bool = False,
+        random_selection: bool = False,
+        seed: Optional[int] = None,
     ) -> OptimizationStrategy:
         """
         Create optimization strategy by name
@@ -30,16 +33,27 @@ class OptimizationStrategyFactory:
             reference_params: Reference parameters
             param_bounds: Parameter bounds
             sample_count: Number of samples for hybrid strategy
+            adaptive_learning_rate: Use AdaGrad-style per-parameter step scaling
+                (simultaneous and hybrid strategies only)
+            random_selection: Pick coordinates by uniform random sampling
+                instead of cycling (coordinate strategy only)
+            seed: Random seed for reproducible coordinate selection
 
         Returns:
             OptimizationStrategy instance
         """
         if strategy_name.lower() == "simultaneous":
-            return SimultaneousOptimizationStrategy(reference_params, param_bounds)
+            return SimultaneousOptimizationStrategy(
+                reference_params, param_bounds, adaptive_learning_rate
+            )
         elif strategy_name.lower() == "hybrid":
-            return HybridOptimizationStrategy(reference_params, param_bounds, sample_count)
+            return HybridOptimizationStrategy(
+                reference_params, param_bounds, sample_count, adaptive_learning_rate
+            )
         elif strategy_name.lower() == "coordinate":
-            return CoordinateDescentOptimizationStrategy(reference_params, param_bounds)
+            return CoordinateDescentOptimizationStrategy(
+                reference_params, param_bounds, random_selection, seed
+            )
         else:
             raise ValueError(f"Unknown optimization strategy: {strategy_name}")
 
@@ -5,8 +5,11 @@ This module contains the HybridOptimizationStrategy class that uses hierarchical
 phases followed by fine-tuning for parameter optimization.
 """
 
-from typing import List, Dict, Any, Tuple
-from .base import OptimizationStrategy
+import bisect
+import itertools
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, Tuple, Union
+from .base import HistoryRecord, OptimizationStrategy, WellData, WellResult
 
 
 class HybridOptimizationStrategy(OptimizationStrategy):
@@ -17,6 +20,7 @@ class HybridOptimizationStrategy(OptimizationStrategy):
         reference_params: Dict[str, float],
         param_bounds: Dict[str, Tuple[float, float]],
         sample_count: int = 96,
+        adaptive_learning_rate: bool = False,
     ):
         super().__init__(reference_params, param_bounds)
 
@@ -24,11 +28,28 @@ class HybridOptimizationStrategy(OptimizationStrategy):
         self.sample_count = sample_count
         self.phase_configs = self._calculate_phase_allocation(sample_count)
 
+        # Flattened per-phase lookups, indexed by phase id (order of phase_configs)
+        self._phase_names = tuple(self.phase_configs)
+        self._phase_params = tuple(tuple(cfg["params"]) for cfg in self.phase_configs.values())
+        self._phase_step_sizes = tuple(
+            MappingProxyType(cfg["step_sizes"]) for cfg in self.phase_configs.values()
+        )
+        self._phase_ends = tuple(
+            itertools.accumulate(cfg["wells_per_phase"] for cfg in self.phase_configs.values())
+        )
+
+        # Frozen per-phase lookups by name, returned as-is by the phase getters
+        self._params_by_phase = dict(zip(self._phase_names, self._phase_params))
+        self._steps_by_phase = dict(zip(self._phase_names, self._phase_step_sizes))
+
         # Phase tracking
         self.current_phase = "flow_rates"
         self.phase_start_well = 0
         self.phase_best_params = self.reference_params.copy()
 
+        # AdaGrad-style per-parameter scaling (legacy fixed steps when disabled)
+        self.adaptive_learning_rate = adaptive_learning_rate
+
     def _calculate_phase_allocation(self, sample_count: int) -> Dict[str, Dict[str, Any]]:
         """Calculate proportional wells per phase based on sample count"""
 
@@ -105,22 +126,21 @@ class HybridOptimizationStrategy(OptimizationStrategy):
     def get_strategy_description(self) -> str:
         return "Hierarchical optimization: Flow rates → Delays → Withdrawal → Fine-tuning"
 
+    def _get_phase_id(self, well_idx: int) -> int:
+        """Index of the phase containing well_idx (wells past the plan stay in the last phase)"""
+        return min(bisect.bisect_right(self._phase_ends, well_idx), len(self._phase_ends) - 1)
+
     def get_current_phase(self, well_idx: int) -> str:
         """Determine current optimization phase based on well index"""
-        wells_used = 0
-        for phase_name, config in self.phase_configs.items():
-            wells_used += config["wells_per_phase"]
-            if well_idx < wells_used:
-                return phase_name
-        return "fine_tune"  # Default to fine-tuning phase
-
-    def get_phase_parameters(self, phase: str) -> List[str]:
+        return self._phase_names[self._get_phase_id(well_idx)]
+
+    def get_phase_parameters(self, phase: str) -> Tuple[str, ...]:
         """Get parameters optimized in the current phase"""
-        return self.phase_configs[phase]["params"]
+        return self._params_by_phase[phase]
 
-    def get_phase_step_sizes(self, phase: str) -> Dict[str, float]:
+    def get_phase_step_sizes(self, phase: str) -> Mapping[str, float]:
         """Get step sizes for the current phase"""
-        return self.phase_configs[phase]["step_sizes"]
+        return self._steps_by_phase[phase]
 
     def calculate_phase_gradient(
         self,
@@ -131,23 +151,13 @@ class HybridOptimizationStrategy(OptimizationStrategy):
         current_params: Dict[str, float],
     ) -> Dict[str, float]:
         """Calculate gradient for parameters in the current phase"""
-        if previous_score == float("inf"):
-            return {param: 0.0 for param in self.get_phase_parameters(phase)}
-
-        gradients = {}
-
-        for param in self.get_phase_parameters(phase):
-            if param in previous_params and param in current_params:
-                param_change = current_params[param] - previous_params[param]
-                if abs(param_change) > 1e-6:
-                    score_change = current_score - previous_score
-                    gradients[param] = -score_change / param_change
-                else:
-                    gradients[param] = 0.0
-            else:
-                gradients[param] = 0.0
-
-        return gradients
+        return self._finite_difference_gradients(
+            self.get_phase_parameters(phase),
+            previous_score,
+            current_score,
+            previous_params,
+            current_params,
+        )
 
     def update_phase_parameters(
         self,
@@ -162,18 +172,27 @@ class HybridOptimizationStrategy(OptimizationStrategy):
 
         for param, gradient in gradients.items():
             if param in updated_params and param in step_sizes:
-                step = learning_rate * step_sizes[param] * gradient
+                step_size = step_sizes[param]
+                if self.adaptive_learning_rate:
+                    step_size = self._adaptive_step(param, gradient, step_size)
+                step = learning_rate * step_size * gradient
                 updated_params[param] += step
 
         return updated_params
 
+    @staticmethod
+    def _phase_of(row: Union[WellResult, Mapping[str, Any]]) -> Optional[str]:
+        """Phase a previous well result was recorded in, for WellResult tuples or dicts"""
+        return row.phase if isinstance(row, WellResult) else row.get("phase")
+
     def generate_parameters(
-        self, well_idx: int, well_data: List[Dict[str, Any]], learning_rate: float
+        self, well_idx: int, well_data: WellData, learning_rate: float
     ) -> Dict[str, float]:
         """Generate parameters using hybrid hierarchical approach"""
 
         # Determine current phase
-        current_phase = self.get_current_phase(well_idx)
+        phase_id = self._get_phase_id(well_idx)
+        current_phase = self._phase_names[phase_id]
 
         # Check if we're starting a new phase
         if current_phase != self.current_phase:
@@ -181,7 +200,7 @@ class HybridOptimizationStrategy(OptimizationStrategy):
             self.phase_start_well = well_idx
             # Use best parameters from previous phase as starting point
             if well_data:
-                self.phase_best_params = well_data[-1]["parameters"].copy()
+                self.phase_best_params = self.as_well_result(well_data[-1]).parameters.copy()
 
         if well_idx == 0:
             # First well - use reference parameters
@@ -194,8 +213,8 @@ class HybridOptimizationStrategy(OptimizationStrategy):
         elif well_idx == self.phase_start_well + 1:
             # Second well of phase - simple exploration
             current_params = self.phase_best_params.copy()
-            phase_params = self.get_phase_parameters(current_phase)
-            step_sizes = self.get_phase_step_sizes(current_phase)
+            phase_params = self._phase_params[phase_id]
+            step_sizes = self._phase_step_sizes[phase_id]
 
             for param in phase_params:
                 if param in current_params and param in step_sizes:
@@ -206,24 +225,24 @@ class HybridOptimizationStrategy(OptimizationStrategy):
 
         else:
             # Subsequent wells in phase - phase-specific gradient descent
-            phase_well_data = [d for d in well_data if d.get("phase") == current_phase]
+            phase_well_data = [d for d in well_data if self._phase_of(d) == current_phase]
 
             if len(phase_well_data) >= 2:
-                last_result = phase_well_data[-1]
-                second_last_result = phase_well_data[-2]
+                last_result = self.as_well_result(phase_well_data[-1])
+                second_last_result = self.as_well_result(phase_well_data[-2])
 
                 # Calculate gradients for current phase parameters
                 gradients = self.calculate_phase_gradient(
                     current_phase,
-                    second_last_result["bubblicity_score"],
-                    last_result["bubblicity_score"],
-                    second_last_result["parameters"],
-                    last_result["parameters"],
+                    second_last_result.bubblicity_score,
+                    last_result.bubblicity_score,
+                    second_last_result.parameters,
+                    last_result.parameters,
                 )
 
                 # Update parameters for current phase only
                 current_params = self.update_phase_parameters(
-                    current_phase, last_result["parameters"], gradients, learning_rate
+                    current_phase, last_result.parameters, gradients, learning_rate
                 )
 
                 return self.apply_constraints(current_params)
@@ -241,19 +260,20 @@ class HybridOptimizationStrategy(OptimizationStrategy):
     ):
         """Record optimization result with phase information"""
         current_phase = self.get_current_phase(well_idx)
+        snapshot = MappingProxyType(parameters)
 
         self.optimization_history.append(
-            {
-                "iteration": well_idx,
-                "phase": current_phase,
-                "parameters": parameters.copy(),
-                "score": score,
-                "height_status": height_status,
-                "learning_rate": learning_rate,
-                "best_score": self.best_score,
-            }
+            HistoryRecord(
+                iteration=well_idx,
+                parameters=snapshot,
+                score=score,
+                height_status=height_status,
+                learning_rate=learning_rate,
+                best_score=self.best_score,
+                phase=current_phase,
+            )
         )
 
         if height_status and score < self.best_score:
             self.best_score = score
-            self.best_params = parameters.copy()
+            self.best_params = snapshot
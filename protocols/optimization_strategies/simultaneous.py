@@ -5,15 +5,18 @@ This module contains the SimultaneousOptimizationStrategy class that optimizes
 all parameters simultaneously using gradient descent.
 """
 
-from typing import List, Dict, Any, Tuple
-from .base import OptimizationStrategy
+from typing import Dict, Tuple
+from .base import OptimizationStrategy, WellData
 
 
 class SimultaneousOptimizationStrategy(OptimizationStrategy):
     """Simultaneous optimization of all parameters using gradient descent"""
 
     def __init__(
-        self, reference_params: Dict[str, float], param_bounds: Dict[str, Tuple[float, float]]
+        self,
+        reference_params: Dict[str, float],
+        param_bounds: Dict[str, Tuple[float, float]],
+        adaptive_learning_rate: bool = False,
     ):
         super().__init__(reference_params, param_bounds)
 
@@ -27,6 +30,9 @@ class SimultaneousOptimizationStrategy(OptimizationStrategy):
             "blowout_rate": 5.0,
         }
 
+        # AdaGrad-style per-parameter scaling (legacy fixed steps when disabled)
+        self.adaptive_learning_rate = adaptive_learning_rate
+
     def get_strategy_name(self) -> str:
         return "Simultaneous Gradient Descent"
 
@@ -41,22 +47,9 @@ class SimultaneousOptimizationStrategy(OptimizationStrategy):
         current_params: Dict[str, float],
     ) -> Dict[str, float]:
         """Calculate gradient direction for each parameter"""
-        if previous_score == float("inf"):
-            return {param: 0.0 for param in self.gradient_step.keys()}
-
-        gradients = {}
-        for param in self.gradient_step.keys():
-            if param in previous_params and param in current_params:
-                param_change = current_params[param] - previous_params[param]
-                if abs(param_change) > 1e-6:  # Avoid division by zero
-                    score_change = current_score - previous_score
-                    gradients[param] = -score_change / param_change
-                else:
-                    gradients[param] = 0.0
-            else:
-                gradients[param] = 0.0
-
-        return gradients
+        return self._finite_difference_gradients(
+            self.gradient_step, previous_score, current_score, previous_params, current_params
+        )
 
     def update_parameters_with_gradient(
         self, current_params: Dict[str, float], gradients: Dict[str, float], learning_rate: float
@@ -66,13 +59,16 @@ class SimultaneousOptimizationStrategy(OptimizationStrategy):
 
         for param, gradient in gradients.items():
             if param in updated_params:
-                step = learning_rate * self.gradient_step[param] * gradient
+                step_size = self.gradient_step[param]
+                if self.adaptive_learning_rate:
+                    step_size = self._adaptive_step(param, gradient, step_size)
+                step = learning_rate * step_size * gradient
                 updated_params[param] += step
 
         return updated_params
 
     def generate_parameters(
-        self, well_idx: int, well_data: List[Dict[str, Any]], learning_rate: float
+        self, well_idx: int, well_data: WellData, learning_rate: float
     ) -> Dict[str, float]:
         """Generate parameters using simultaneous gradient descent"""
 
@@ -92,20 +88,20 @@ class SimultaneousOptimizationStrategy(OptimizationStrategy):
         else:
             # Subsequent wells - gradient descent
             if len(well_data) >= 2:
-                last_result = well_data[-1]
-                second_last_result = well_data[-2]
+                last_result = self.as_well_result(well_data[-1])
+                second_last_result = self.as_well_result(well_data[-2])
 
                 # Calculate gradients
                 gradients = self.calculate_gradient_direction(
-                    second_last_result["bubblicity_score"],
-                    last_result["bubblicity_score"],
-                    second_last_result["parameters"],
-                    last_result["parameters"],
+                    second_last_result.bubblicity_score,
+                    last_result.bubblicity_score,
+                    second_last_result.parameters,
+                    last_result.parameters,
                 )
 
                 # Update parameters
                 current_params = self.update_parameters_with_gradient(
-                    last_result["parameters"], gradients, learning_rate
+                    last_result.parameters, gradients, learning_rate
                 )
 
                 return self.apply_constraints(current_params)
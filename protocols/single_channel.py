@@ -1,17 +1,24 @@
+import itertools
+import random
 import sys
 import os
 
-try:
-    protocol_dir = os.path.dirname(os.path.abspath(__file__))
-except NameError:
-    # __file__ is not defined (e.g., in Opentrons simulation)
-    protocol_dir = os.getcwd()
+if __package__ in (None, ""):
+    # Loaded as a loose script rather than imported from the protocols package: make the
+    # project root, the parent of this protocols/ directory, importable so the liquids and
+    # protocols imports below resolve. The Opentrons runtime execs the source without
+    # __file__, from the project root.
+    try:
+        project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    except NameError:
+        project_root = os.getcwd()
 
-if protocol_dir not in sys.path:
-    sys.path.insert(0, protocol_dir)
+    if project_root not in sys.path:
+        sys.path.insert(0, project_root)
 
 from opentrons import protocol_api, types
-from typing import List, Dict, Any
+from statistics import pvariance
+from typing import List, Dict, Any, NamedTuple
 
 # Import liquid classes
 from liquids.liquid_classes import (
@@ -22,7 +29,11 @@ from liquids.liquid_classes import (
 )
 
 # Import optimization strategies
-from protocols.optimization_strategies import OptimizationStrategyFactory, OptimizationStrategy
+from protocols.optimization_strategies import (
+    OptimizationStrategyFactory,
+    OptimizationStrategy,
+    WellResult,
+)
 
 metadata = {
     "protocolName": "Liquid Class Calibration with Pluggable Optimization",
@@ -36,9 +47,108 @@ metadata = {
 
 requirements = {"robotType": "Flex", "apiLevel": "2.22"}
 
+# Display colors for the calibration liquid
+_LIQUID_COLORS = {
+    LiquidType.GLYCEROL_10: "#FFE4B5",  # Light gold for 10% glycerol
+    LiquidType.GLYCEROL_50: "#FFD700",  # Gold for 50% glycerol
+    LiquidType.GLYCEROL_90: "#FFA500",  # Orange for 90% glycerol
+    LiquidType.GLYCEROL_99: "#FF8C00",  # Dark orange for 99% glycerol
+    LiquidType.PEG_8000_50: "#DDA0DD",  # Plum for PEG
+    LiquidType.SANITIZER_62_ALCOHOL: "#98FB98",  # Pale green for sanitizer
+    LiquidType.TWEEN_20_100: "#F0E68C",  # Khaki for Tween
+    LiquidType.ENGINE_OIL_100: "#2F4F4F",  # Dark slate gray for engine oil
+    LiquidType.WATER: "#87CEEB",  # Sky blue for water
+    LiquidType.DMSO: "#98FB98",  # Pale green for DMSO
+    LiquidType.ETHANOL: "#F0E68C",  # Khaki for ethanol
+}
+
+# Horizontal sweep positions relative to the well center
+_SWEEP_POINTS = [types.Point(x, y, 0) for x, y in ((0, 0), (1, 0), (-1, 0), (0, 1), (0, -1))]
+
+
+class _ScoreBreakdown(NamedTuple):
+    """Simulated bubblicity score together with the terms it was built from"""
+
+    aspiration_factor: float
+    aspiration_contribution: float
+    dispense_factor: float
+    dispense_contribution: float
+    blowout_factor: float
+    blowout_contribution: float
+    delay_factor: float
+    delay_contribution: float
+    base_score: float
+    edge_penalty: float
+    final_score: float
+
+
+def _simulated_score(
+    aspiration_rate: float,
+    dispense_rate: float,
+    blowout_rate: float,
+    aspiration_delay: float,
+    dispense_delay: float,
+    edge_factor: float,
+    noise: float,
+) -> _ScoreBreakdown:
+    """Pure arithmetic core of the simulated evaluation"""
+    # Base score that varies with parameters
+    base_score = 0.0
+
+    # Parameter effects on score (simulated)
+    # Lower aspiration rate generally better for bubble reduction
+    aspiration_factor = max(0.1, 1.0 - (aspiration_rate - 50) / 450)
+    aspiration_contribution = (1.0 - aspiration_factor) * 2.0
+    base_score += aspiration_contribution
+
+    # Lower dispense rate generally better
+    dispense_factor = max(0.1, 1.0 - (dispense_rate - 50) / 450)
+    dispense_contribution = (1.0 - dispense_factor) * 2.0
+    base_score += dispense_contribution
+
+    # Moderate blowout rate is optimal
+    blowout_optimal = 50.0
+    blowout_factor = 1.0 - abs(blowout_rate - blowout_optimal) / blowout_optimal
+    blowout_contribution = (1.0 - max(0, blowout_factor)) * 1.5
+    base_score += blowout_contribution
+
+    # Delays can help but too much is bad
+    delay_factor = min(1.0, (aspiration_delay + dispense_delay) / 2.0)
+    delay_contribution = delay_factor * 0.5
+    base_score += delay_contribution
+
+    # Well position effects (edges vs center)
+    edge_penalty = edge_factor * 0.1
+
+    final_score = max(0.0, base_score + noise + edge_penalty)
+
+    return _ScoreBreakdown(
+        aspiration_factor,
+        aspiration_contribution,
+        dispense_factor,
+        dispense_contribution,
+        blowout_factor,
+        blowout_contribution,
+        delay_factor,
+        delay_contribution,
+        base_score,
+        edge_penalty,
+        final_score,
+    )
+
 
 def get_default_liquid_class_params(pipette: PipetteType, liquid: LiquidType) -> LiquidClassParams:
     """Get default liquid class parameters for combinations not in the registry"""
+    params = _DEFAULT_PARAMS.get((pipette, liquid))
+    if params is None:
+        params = _build_default_liquid_class_params(pipette, liquid)
+    return params
+
+
+def _build_default_liquid_class_params(
+    pipette: PipetteType, liquid: LiquidType
+) -> LiquidClassParams:
+    """Derive default liquid class parameters from the pipette and liquid type"""
 
     # Initialize base_params with default values
     base_params: Dict[str, Any] = {
@@ -109,6 +219,13 @@ def get_default_liquid_class_params(pipette: PipetteType, liquid: LiquidType) ->
     )
 
 
+# Every pipette/liquid default is fixed, so resolve them all once at import time
+_DEFAULT_PARAMS = {
+    (pipette, liquid): _build_default_liquid_class_params(pipette, liquid)
+    for pipette, liquid in itertools.product(PipetteType, LiquidType)
+}
+
+
 def add_parameters(parameters):
     parameters.add_int(
         display_name="Sample count",
@@ -190,6 +307,32 @@ def add_parameters(parameters):
         default="simultaneous",
         description="Optimization strategy to use for parameter tuning",
     )
+    parameters.add_bool(
+        display_name="Verbose logging",
+        variable_name="verbose_logging",
+        default=True,
+        description="Log per-well parameters and evaluation breakdowns",
+    )
+    parameters.add_bool(
+        display_name="Adaptive learning rate",
+        variable_name="adaptive_learning_rate",
+        default=False,
+        description="Scale each parameter's step AdaGrad-style (simultaneous and hybrid only)",
+    )
+    parameters.add_bool(
+        display_name="Random coordinate order",
+        variable_name="random_selection",
+        default=False,
+        description="Pick the next coordinate at random instead of cycling (coordinate only)",
+    )
+    parameters.add_int(
+        display_name="Coordinate seed",
+        variable_name="coordinate_seed",
+        default=0,
+        minimum=0,
+        maximum=9999,
+        description="Random seed for reproducible coordinate order (coordinate only)",
+    )
 
 
 def run(protocol: protocol_api.ProtocolContext):
@@ -200,6 +343,10 @@ def run(protocol: protocol_api.ProtocolContext):
     LIQUID_TYPE = LiquidType[protocol.params.liquid_type]  # type: ignore
     PIPETTE_TYPE = PipetteType[protocol.params.pipette_type]  # type: ignore
     OPTIMIZATION_STRATEGY = protocol.params.optimization_strategy  # type: ignore
+    VERBOSE_LOGGING = protocol.params.verbose_logging  # type: ignore
+    ADAPTIVE_LEARNING_RATE = protocol.params.adaptive_learning_rate  # type: ignore
+    RANDOM_SELECTION = protocol.params.random_selection  # type: ignore
+    COORDINATE_SEED = protocol.params.coordinate_seed  # type: ignore
 
     # Load labware
     reservoir = protocol.load_labware("nest_12_reservoir_15ml", "D1")
@@ -243,30 +390,7 @@ def run(protocol: protocol_api.ProtocolContext):
     # Define liquid based on liquid type
     liquid_name = LIQUID_TYPE.value
     liquid_description = f"Calibration liquid for {liquid_name}"
-    liquid_color = "#FFD700"  # Default gold color
-
-    if LIQUID_TYPE == LiquidType.GLYCEROL_10:
-        liquid_color = "#FFE4B5"  # Light gold for 10% glycerol
-    elif LIQUID_TYPE == LiquidType.GLYCEROL_50:
-        liquid_color = "#FFD700"  # Gold for 50% glycerol
-    elif LIQUID_TYPE == LiquidType.GLYCEROL_90:
-        liquid_color = "#FFA500"  # Orange for 90% glycerol
-    elif LIQUID_TYPE == LiquidType.GLYCEROL_99:
-        liquid_color = "#FF8C00"  # Dark orange for 99% glycerol
-    elif LIQUID_TYPE == LiquidType.PEG_8000_50:
-        liquid_color = "#DDA0DD"  # Plum for PEG
-    elif LIQUID_TYPE == LiquidType.SANITIZER_62_ALCOHOL:
-        liquid_color = "#98FB98"  # Pale green for sanitizer
-    elif LIQUID_TYPE == LiquidType.TWEEN_20_100:
-        liquid_color = "#F0E68C"  # Khaki for Tween
-    elif LIQUID_TYPE == LiquidType.ENGINE_OIL_100:
-        liquid_color = "#2F4F4F"  # Dark slate gray for engine oil
-    elif LIQUID_TYPE == LiquidType.WATER:
-        liquid_color = "#87CEEB"  # Sky blue for water
-    elif LIQUID_TYPE == LiquidType.DMSO:
-        liquid_color = "#98FB98"  # Pale green for DMSO
-    elif LIQUID_TYPE == LiquidType.ETHANOL:
-        liquid_color = "#F0E68C"  # Khaki for ethanol
+    liquid_color = _LIQUID_COLORS.get(LIQUID_TYPE, "#FFD700")  # Default gold color
 
     liquid = protocol.define_liquid(
         name=liquid_name,
@@ -283,13 +407,23 @@ def run(protocol: protocol_api.ProtocolContext):
     protocol.comment(
         f"📊 Using pipette-specific bounds for {PIPETTE_TYPE.value} with {LIQUID_TYPE.value}:"
     )
-    for param, (min_val, max_val) in param_bounds.items():
-        protocol.comment(f"    {param}: {min_val:.1f} - {max_val:.1f}")
+    protocol.comment(
+        "\n".join(
+            f"    {param}: {min_val:.1f} - {max_val:.1f}"
+            for param, (min_val, max_val) in param_bounds.items()
+        )
+    )
 
     # Initialize optimization strategy
     try:
         optimization_strategy = OptimizationStrategyFactory.create_strategy(
-            OPTIMIZATION_STRATEGY, reference_params, param_bounds, SAMPLE_COUNT
+            OPTIMIZATION_STRATEGY,
+            reference_params,
+            param_bounds,
+            SAMPLE_COUNT,
+            adaptive_learning_rate=ADAPTIVE_LEARNING_RATE,
+            random_selection=RANDOM_SELECTION,
+            seed=COORDINATE_SEED,
         )
         protocol.comment(
             f"✅ Using optimization strategy: {optimization_strategy.get_strategy_name()}"
@@ -326,35 +460,28 @@ def run(protocol: protocol_api.ProtocolContext):
     # Detection parameters
     expected_liquid_height = 2.0  # mm from bottom
     bubble_check_increments = [0.5, 1.0, 1.5, 2.0, 2.5]  # mm above expected height
-    horizontal_sweep_points = [
-        (0, 0),
-        (1, 0),
-        (-1, 0),
-        (0, 1),
-        (0, -1),
-    ]  # relative positions
 
     # Data storage
-    well_data: List[Dict[str, Any]] = []
-    optimization_history: List[Dict[str, Any]] = []
+    well_data: List[WellResult] = []
+    # Per-well optimization history, stored column-wise (index == well iteration)
+    learning_rate_history: List[float] = []
+    score_history: List[float] = []
+    best_score_history: List[float] = []
 
     def evaluate_liquid_height_with_tip(well, pipette, expected_height):
         """Evaluate if liquid is at expected height (assumes tip is already attached)"""
         protocol.comment(f"Evaluating liquid height in {well}")
 
         # Move to expected height
-        pipette.move_to(well.bottom(expected_height))
+        check_location = well.bottom(expected_height)
+        pipette.move_to(check_location)
 
         # Horizontal sweep to check pressure
         height_status = True
-        for x_offset, y_offset in horizontal_sweep_points:
+        for point in _SWEEP_POINTS:
             try:
-                # Move to sweep position using well coordinates
-                # Calculate relative position from well center
-                target_location = well.bottom(expected_height).move(
-                    types.Point(x_offset, y_offset, 0)
-                )
-                pipette.move_to(target_location)
+                # Move to sweep position relative to the well center
+                pipette.move_to(check_location.move(point))
 
                 # Check for liquid presence (simulated pressure check)
                 # Note: In actual implementation, this would use pressure sensor
@@ -379,17 +506,14 @@ def run(protocol: protocol_api.ProtocolContext):
         bubblicity_score = 0
 
         for height_increment in bubble_check_increments:
-            check_height = expected_height + height_increment
-            pipette.move_to(well.bottom(check_height))
+            check_location = well.bottom(expected_height + height_increment)
+            pipette.move_to(check_location)
 
             # Check for bubbles at this height
             bubble_detected = False
-            for x_offset, y_offset in horizontal_sweep_points:
+            for point in _SWEEP_POINTS:
                 try:
-                    target_location = well.bottom(check_height).move(
-                        types.Point(x_offset, y_offset, 0)
-                    )
-                    pipette.move_to(target_location)
+                    pipette.move_to(check_location.move(point))
 
                     # Simulated bubble detection via pressure
                     # In real implementation, this would check pressure sensor
@@ -405,9 +529,8 @@ def run(protocol: protocol_api.ProtocolContext):
             if bubble_detected:
                 break
 
-            # Return to safe height between checks
-            pipette.move_to(well.top(10))
-
+        # Return to safe height once all checks are done; consecutive checks stay in the well
+        pipette.move_to(well.top(10))
         return bubblicity_score
 
     def execute_dispense_sequence(well, pipette, params, volume=100):
@@ -419,9 +542,10 @@ def run(protocol: protocol_api.ProtocolContext):
 
         try:
             # Set flow rates (simplified - actual implementation would set all parameters)
-            pipette.flow_rate.aspirate = params["aspiration_rate"]
-            pipette.flow_rate.dispense = params["dispense_rate"]
-            pipette.flow_rate.blow_out = params["blowout_rate"]
+            flow_rate = pipette.flow_rate
+            flow_rate.aspirate = params["aspiration_rate"]
+            flow_rate.dispense = params["dispense_rate"]
+            flow_rate.blow_out = params["blowout_rate"]
 
             # Aspirate from reservoir - target specific well
             pipette.aspirate(volume, reservoir["A1"])
@@ -443,81 +567,63 @@ def run(protocol: protocol_api.ProtocolContext):
         finally:
             pipette.drop_tip()
 
-    def simulate_realistic_evaluation(well, params, well_idx):
+    def simulate_realistic_evaluation(params, well_idx, edge_factor):
         """Simulate realistic evaluation results based on parameters and well position"""
-        # Base score that varies with parameters
-        base_score = 0.0
-
-        # Parameter effects on score (simulated)
-        # Lower aspiration rate generally better for bubble reduction
-        aspiration_factor = max(0.1, 1.0 - (params["aspiration_rate"] - 50) / 450)
-        aspiration_contribution = (1.0 - aspiration_factor) * 2.0
-        base_score += aspiration_contribution
-
-        # Lower dispense rate generally better
-        dispense_factor = max(0.1, 1.0 - (params["dispense_rate"] - 50) / 450)
-        dispense_contribution = (1.0 - dispense_factor) * 2.0
-        base_score += dispense_contribution
-
-        # Moderate blowout rate is optimal
-        blowout_optimal = 50.0
-        blowout_factor = 1.0 - abs(params["blowout_rate"] - blowout_optimal) / blowout_optimal
-        blowout_contribution = (1.0 - max(0, blowout_factor)) * 1.5
-        base_score += blowout_contribution
-
-        # Delays can help but too much is bad
-        delay_factor = min(1.0, (params["aspiration_delay"] + params["dispense_delay"]) / 2.0)
-        delay_contribution = delay_factor * 0.5
-        base_score += delay_contribution
-
-        # Add some randomness and well position effects
-        import random
-
-        random.seed(well_idx)  # Consistent randomness per well
-        noise = random.uniform(-0.5, 0.5)
-
-        # Well position effects (edges vs center)
-        well_row = ord(well.well_name[0]) - ord("A")
-        well_col = int(well.well_name[1:]) - 1
-        edge_factor = abs(well_row - 3.5) + abs(well_col - 3.5)  # Distance from center
-        edge_penalty = edge_factor * 0.1
-
-        final_score = max(0.0, base_score + noise + edge_penalty)
-
-        # Log evaluation breakdown
-        protocol.comment("  Evaluation breakdown:")
-        protocol.comment(
-            f"    Aspiration factor: {aspiration_factor:.3f} "
-            f"(contribution: {aspiration_contribution:.3f})"
-        )
-        protocol.comment(
-            f"    Dispense factor: {dispense_factor:.3f} "
-            f"(contribution: {dispense_contribution:.3f})"
-        )
-        protocol.comment(
-            f"    Blowout factor: {blowout_factor:.3f} "
-            f"(contribution: {blowout_contribution:.3f})"
-        )
-        protocol.comment(
-            f"    Delay factor: {delay_factor:.3f} " f"(contribution: {delay_contribution:.3f})"
+        # Add some randomness, consistent per well without touching the global RNG
+        noise = random.Random(well_idx).uniform(-0.5, 0.5)
+
+        score = _simulated_score(
+            params["aspiration_rate"],
+            params["dispense_rate"],
+            params["blowout_rate"],
+            params["aspiration_delay"],
+            params["dispense_delay"],
+            edge_factor,
+            noise,
         )
-        protocol.comment(f"    Base score: {base_score:.3f}")
-        protocol.comment(f"    Noise: {noise:+.3f}")
-        protocol.comment(f"    Edge penalty: {edge_penalty:.3f}")
-        protocol.comment(f"    Final score: {final_score:.3f}")
 
-        return final_score
+        # Log evaluation breakdown as a single comment
+        if VERBOSE_LOGGING:
+            protocol.comment(
+                "\n".join(
+                    [
+                        "  Evaluation breakdown:",
+                        f"    Aspiration factor: {score.aspiration_factor:.3f} "
+                        f"(contribution: {score.aspiration_contribution:.3f})",
+                        f"    Dispense factor: {score.dispense_factor:.3f} "
+                        f"(contribution: {score.dispense_contribution:.3f})",
+                        f"    Blowout factor: {score.blowout_factor:.3f} "
+                        f"(contribution: {score.blowout_contribution:.3f})",
+                        f"    Delay factor: {score.delay_factor:.3f} "
+                        f"(contribution: {score.delay_contribution:.3f})",
+                        f"    Base score: {score.base_score:.3f}",
+                        f"    Noise: {noise:+.3f}",
+                        f"    Edge penalty: {score.edge_penalty:.3f}",
+                        f"    Final score: {score.final_score:.3f}",
+                    ]
+                )
+            )
+
+        return score.final_score
 
     # Main optimization loop - test all wells individually
-    current_params = reference_params.copy()
     best_score = float("inf")
     best_params = reference_params.copy()
+    best_well_idx = -1
+    successful_count = 0
     learning_rate = initial_learning_rate
     no_improvement_count = 0
 
     # Get all wells to test
     test_wells = test_plate.wells()[:SAMPLE_COUNT]
 
+    # Well position effects depend only on the well name, so decode them once up front
+    edge_factors = [
+        abs((ord(w.well_name[0]) - ord("A")) - 3.5)  # Row distance from center
+        + abs((int(w.well_name[1:]) - 1) - 3.5)  # Column distance from center
+        for w in test_wells
+    ]
+
     # Log initial setup
     protocol.comment("=" * 60)
     protocol.comment("PLUGGABLE OPTIMIZATION STRATEGY STARTED")
@@ -530,30 +636,35 @@ def run(protocol: protocol_api.ProtocolContext):
     protocol.comment(f"Initial learning rate: {initial_learning_rate}")
     protocol.comment("=" * 60)
 
-    for well_idx, well in enumerate(test_wells):
-        protocol.comment(f"\n--- WELL {well_idx + 1}/{SAMPLE_COUNT}: {well} ---")
+    # Strategy name and phase support are fixed at construction, so resolve them once
+    strategy_name = optimization_strategy.get_strategy_name()
+    has_phase = hasattr(optimization_strategy, "current_phase")
 
+    for well_idx, well in enumerate(test_wells):
         # Generate parameters using the optimization strategy
         current_params = optimization_strategy.generate_parameters(
             well_idx, well_data, learning_rate
         )
 
-        # Log parameter generation
-        if well_idx == 0:
-            protocol.comment("Using reference liquid class parameters for first well")
-        else:
-            protocol.comment(
-                f"Generated parameters using {optimization_strategy.get_strategy_name()}"
-            )
-            # Check for phase information (hybrid strategy specific)
-            current_phase = getattr(optimization_strategy, "current_phase", None)
-            if current_phase:
-                protocol.comment(f"Current phase: {current_phase}")
+        # Log parameter generation (collected into one comment per well)
+        log_lines = [f"\n--- WELL {well_idx + 1}/{SAMPLE_COUNT}: {well} ---"]
+        if VERBOSE_LOGGING:
+            if well_idx == 0:
+                log_lines.append("Using reference liquid class parameters for first well")
+            else:
+                log_lines.append(f"Generated parameters using {strategy_name}")
+                # Check for phase information (hybrid strategy specific)
+                current_phase = (
+                    optimization_strategy.current_phase if has_phase else None  # type: ignore
+                )
+                if current_phase:
+                    log_lines.append(f"Current phase: {current_phase}")
 
-        protocol.comment(f"Current parameters: {current_params}")
+            log_lines.append(f"Current parameters: {current_params}")
 
         # Step 1.2: Execute dispense sequence targeting individual well
-        protocol.comment("Executing dispense sequence...")
+        log_lines.append("Executing dispense sequence...")
+        protocol.comment("\n".join(log_lines))
         execute_dispense_sequence(well, pipette_1000, current_params)
 
         # Step 1.3 & 1.4: Evaluate liquid height and bubblicity using the same tip
@@ -573,21 +684,24 @@ def run(protocol: protocol_api.ProtocolContext):
                 protocol.comment("Liquid height check failed - setting high bubblicity score")
             else:
                 # Use realistic simulation for evaluation
-                bubblicity_score = simulate_realistic_evaluation(well, current_params, well_idx)
+                bubblicity_score = simulate_realistic_evaluation(
+                    current_params, well_idx, edge_factors[well_idx]
+                )
                 protocol.comment(f"Simulated bubblicity score: {bubblicity_score:.3f}")
 
         finally:
             # Drop the tip after both evaluations
             pipette_50.drop_tip()
 
-        # Record well data
-        well_result = {
-            "well_id": str(well),
-            "well_index": well_idx,
-            "parameters": current_params.copy(),
-            "height_status": height_status,
-            "bubblicity_score": bubblicity_score,
-        }
+        # Record well data (generate_parameters hands out a fresh dict per well, so it is
+        # shared with the strategy history and best_params rather than copied)
+        well_result = WellResult(
+            well_id=str(well),
+            well_index=well_idx,
+            parameters=current_params,
+            height_status=height_status,
+            bubblicity_score=bubblicity_score,
+        )
         well_data.append(well_result)
 
         # Record result in optimization strategy
@@ -596,47 +710,47 @@ def run(protocol: protocol_api.ProtocolContext):
         )
 
         # Track optimization progress
+        log_lines = []
+        if height_status:
+            successful_count += 1
         if height_status and bubblicity_score < best_score:
             best_score = bubblicity_score
-            best_params = current_params.copy()
+            best_params = current_params
+            best_well_idx = well_idx
             no_improvement_count = 0
-            protocol.comment(f"🎉 NEW BEST SCORE: {best_score:.3f} in {well}")
-            protocol.comment(f"Best parameters so far: {best_params}")
+            log_lines.append(f"🎉 NEW BEST SCORE: {best_score:.3f} in {well}")
+            if VERBOSE_LOGGING:
+                log_lines.append(f"Best parameters so far: {best_params}")
         else:
             no_improvement_count += 1
-            if height_status:
-                protocol.comment(
+            if not height_status:
+                log_lines.append("Height check failed - skipping optimization")
+            elif VERBOSE_LOGGING:
+                log_lines.append(
                     f"Score: {bubblicity_score:.3f} (no improvement, count: "
                     f"{no_improvement_count})"
                 )
-            else:
-                protocol.comment("Height check failed - skipping optimization")
 
         # Learning rate decay
         if no_improvement_count >= patience:
             old_learning_rate = learning_rate
             learning_rate = max(min_learning_rate, learning_rate * learning_rate_decay)
             no_improvement_count = 0
-            protocol.comment(
+            log_lines.append(
                 f"📉 Reducing learning rate: {old_learning_rate:.4f} -> " f"{learning_rate:.4f}"
             )
 
-        protocol.comment(
+        log_lines.append(
             f"Progress: {well_idx + 1}/{SAMPLE_COUNT} wells, "
             f"Best score: {best_score:.3f}, "
             f"Learning rate: {learning_rate:.4f}"
         )
+        protocol.comment("\n".join(log_lines))
 
         # Store optimization history
-        optimization_history.append(
-            {
-                "iteration": well_idx,
-                "learning_rate": learning_rate,
-                "current_score": bubblicity_score,
-                "best_score": best_score,
-                "no_improvement_count": no_improvement_count,
-            }
-        )
+        learning_rate_history.append(learning_rate)
+        score_history.append(bubblicity_score)
+        best_score_history.append(best_score)
 
         # Update for next iteration (parameters handled by strategy)
 
@@ -646,26 +760,21 @@ def run(protocol: protocol_api.ProtocolContext):
     protocol.comment("=" * 60)
 
     if well_data:
-        # Filter successful height results and find minimum bubblicity
-        successful_results = [r for r in well_data if r["height_status"]]
-
-        if successful_results:
+        if best_well_idx >= 0:
             # Use the best parameters found during optimization
-            optimal_result = min(successful_results, key=lambda x: x["bubblicity_score"])
-            protocol.comment(f"🏆 OPTIMAL PARAMETERS FOUND IN: {optimal_result['well_id']}")
-            protocol.comment(
-                f"🏆 OPTIMAL BUBBLICITY SCORE: {optimal_result['bubblicity_score']:.3f}"
-            )
+            optimal_result = well_data[best_well_idx]
+            protocol.comment(f"🏆 OPTIMAL PARAMETERS FOUND IN: {optimal_result.well_id}")
+            protocol.comment(f"🏆 OPTIMAL BUBBLICITY SCORE: {optimal_result.bubblicity_score:.3f}")
             protocol.comment("🏆 OPTIMAL PARAMETERS:")
-            for param, value in optimal_result["parameters"].items():
+            for param, value in optimal_result.parameters.items():
                 protocol.comment(f"    {param}: {value:.2f}")
 
             # Compare with reference parameters
             protocol.comment("\n📊 PARAMETER COMPARISON (Reference → Optimal):")
-            for param in optimal_result["parameters"]:
+            for param in optimal_result.parameters:
                 if param in reference_params:
                     ref_val = reference_params[param]
-                    opt_val = optimal_result["parameters"][param]
+                    opt_val = optimal_result.parameters[param]
                     change = opt_val - ref_val
                     change_pct = (change / ref_val) * 100 if ref_val != 0 else 0
                     protocol.comment(
@@ -692,19 +801,19 @@ def run(protocol: protocol_api.ProtocolContext):
             # Additional analysis
             protocol.comment("\n📈 OPTIMIZATION STATISTICS:")
             protocol.comment(f"    Total wells tested: {len(well_data)}")
-            protocol.comment(f"    Successful height checks: {len(successful_results)}")
-            protocol.comment(f"    Success rate: {len(successful_results)/len(well_data)*100:.1f}%")
+            protocol.comment(f"    Successful height checks: {successful_count}")
+            protocol.comment(f"    Success rate: {successful_count/len(well_data)*100:.1f}%")
 
             # Optimization statistics
-            if optimization_history:
-                final_learning_rate = optimization_history[-1]["learning_rate"]
-                best_score_found = optimization_history[-1]["best_score"]
+            if score_history:
+                final_learning_rate = learning_rate_history[-1]
+                best_score_found = best_score_history[-1]
                 protocol.comment(f"    Final learning rate: {final_learning_rate:.4f}")
                 protocol.comment(f"    Best score achieved: {best_score_found:.3f}")
 
                 # Show improvement over iterations
-                if len(optimization_history) > 1:
-                    initial_score = optimization_history[0]["current_score"]
+                if len(score_history) > 1:
+                    initial_score = score_history[0]
                     improvement = initial_score - best_score_found
                     improvement_pct = (
                         (improvement / initial_score) * 100 if initial_score != 0 else 0
@@ -714,12 +823,9 @@ def run(protocol: protocol_api.ProtocolContext):
                     )
 
                     # Show convergence analysis
-                    recent_scores = [h["current_score"] for h in optimization_history[-5:]]
+                    recent_scores = score_history[-5:]
                     if len(recent_scores) >= 2:
-                        score_variance = sum(
-                            (s - sum(recent_scores) / len(recent_scores)) ** 2
-                            for s in recent_scores
-                        ) / len(recent_scores)
+                        score_variance = pvariance(recent_scores)
                         protocol.comment(f"    Recent score variance: {score_variance:.4f}")
                         if score_variance < convergence_threshold:
                             protocol.comment("    ✅ Algorithm appears to have converged")
@@ -728,59 +834,43 @@ def run(protocol: protocol_api.ProtocolContext):
                                 "    ⚠️  Algorithm may need more iterations to converge"
                             )
 
-                # Show learning rate history
-                learning_rate_changes = []
-                for i in range(1, len(optimization_history)):
-                    if (
-                        optimization_history[i]["learning_rate"]
-                        != optimization_history[i - 1]["learning_rate"]
-                    ):
-                        learning_rate_changes.append(
-                            {
-                                "iteration": optimization_history[i]["iteration"],
-                                "old_rate": optimization_history[i - 1]["learning_rate"],
-                                "new_rate": optimization_history[i]["learning_rate"],
-                            }
-                        )
+                # Collect learning rate changes and best-score improvements in one pass
+                learning_rate_changes = []  # (iteration, old_rate, new_rate)
+                improvements = []  # (iteration, improvement)
+                prev_rate = learning_rate_history[0]
+                prev_best = best_score_history[0]
+                for i in range(1, len(score_history)):
+                    rate = learning_rate_history[i]
+                    best = best_score_history[i]
+                    if rate != prev_rate:
+                        learning_rate_changes.append((i, prev_rate, rate))
+                    if best < prev_best:
+                        improvements.append((i, prev_best - best))
+                    prev_rate = rate
+                    prev_best = best
 
+                # Show learning rate history
                 if learning_rate_changes:
-                    protocol.comment(f"    Learning rate changes: {len(learning_rate_changes)}")
-                    for change in learning_rate_changes:
-                        protocol.comment(
-                            f"      Iteration {change['iteration']}: "
-                            f"{change['old_rate']:.4f} → {change['new_rate']:.4f}"
-                        )
-
-                # Show score progression
-                protocol.comment("\n📉 SCORE PROGRESSION:")
-                protocol.comment(
-                    f"    Initial score: {optimization_history[0]['current_score']:.3f}"
-                )
-                protocol.comment(
-                    f"    Final score: {optimization_history[-1]['current_score']:.3f}"
-                )
-
-                # Find iterations with improvements
-                improvements = []
-                for i in range(1, len(optimization_history)):
-                    if (
-                        optimization_history[i]["best_score"]
-                        < optimization_history[i - 1]["best_score"]
-                    ):
-                        improvements.append(
-                            {
-                                "iteration": optimization_history[i]["iteration"],
-                                "improvement": optimization_history[i - 1]["best_score"]
-                                - optimization_history[i]["best_score"],
-                            }
-                        )
-
+                    lines = [f"    Learning rate changes: {len(learning_rate_changes)}"]
+                    lines.extend(
+                        f"      Iteration {iteration}: {old_rate:.4f} → {new_rate:.4f}"
+                        for iteration, old_rate, new_rate in learning_rate_changes
+                    )
+                    protocol.comment("\n".join(lines))
+
+                # Show score progression and iterations with improvements
+                lines = [
+                    "\n📉 SCORE PROGRESSION:",
+                    f"    Initial score: {score_history[0]:.3f}",
+                    f"    Final score: {score_history[-1]:.3f}",
+                ]
                 if improvements:
-                    protocol.comment(f"    Major improvements: {len(improvements)}")
-                    for imp in improvements:
-                        protocol.comment(
-                            f"      Iteration {imp['iteration']}: +{imp['improvement']:.3f}"
-                        )
+                    lines.append(f"    Major improvements: {len(improvements)}")
+                    lines.extend(
+                        f"      Iteration {iteration}: +{improvement:.3f}"
+                        for iteration, improvement in improvements
+                    )
+                protocol.comment("\n".join(lines))
         else:
             protocol.comment("❌ No successful liquid height results found")
             protocol.comment("   This may indicate issues with liquid handling or evaluation")
@@ -3,22 +3,68 @@
 Wrapper script to run Opentrons simulation with command-line arguments
 """
 
+import contextlib
+import io
+import re
 import sys
-import subprocess
 import tempfile
+import textwrap
 import os
+import traceback
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+# Liquid types accepted on the command line with their descriptions, in display order
+LIQUID_DESCRIPTIONS = {
+    "GLYCEROL_10": "Glycerol 10% - Low viscosity aqueous solution",
+    "GLYCEROL_50": "Glycerol 50% - Medium viscosity aqueous solution",
+    "GLYCEROL_90": "Glycerol 90% - High viscosity aqueous solution",
+    "GLYCEROL_99": "Glycerol 99% - Very high viscosity solution",
+    "PEG_8000_50": "PEG 8000 50% w/v - Polyethylene glycol solution",
+    "SANITIZER_62_ALCOHOL": "Sanitizer 62% Alcohol - Volatile alcohol solution",
+    "TWEEN_20_100": "Tween 20 100% - Surfactant solution",
+    "ENGINE_OIL_100": "Engine oil 100% - High viscosity oil",
+    "WATER": "Water - Standard aqueous solution",
+    "DMSO": "DMSO - Dimethyl sulfoxide, volatile organic solvent",
+    "ETHANOL": "Ethanol - Volatile alcohol",
+}
+LIQUID_TYPES = tuple(LIQUID_DESCRIPTIONS)
+VALID_LIQUIDS = frozenset(LIQUID_TYPES)
+
+# Import the liquid classes module once, from the directory the script is run in
+if str(Path.cwd()) not in sys.path:
+    sys.path.insert(0, str(Path.cwd()))
+
+try:
+    from liquids.liquid_classes import get_liquid_class_params, PipetteType, LiquidType
+
+    _LIQUID_CLASSES_IMPORT_ERROR = None
+except ImportError as e:
+    get_liquid_class_params = PipetteType = LiquidType = None
+    _LIQUID_CLASSES_IMPORT_ERROR = e
 
 
 def get_liquid_class_params_from_module(liquid_type, pipette_type="P1000"):
-    """Dynamically evaluate the liquid_classes module to get parameters"""
+    """
+    Dynamically evaluate the liquid_classes module to get parameters
 
-    try:
-        # Import the liquid classes module
-        sys.path.insert(0, str(Path.cwd()))
-        from liquids.liquid_classes import get_liquid_class_params, PipetteType, LiquidType
+    Results are cached per (liquid_type, pipette_type) and returned as read-only
+    mappings; copy before modifying.
+    """
+    return _cached_liquid_class_params(liquid_type, pipette_type)
+
+
+@lru_cache(maxsize=128)
+def _cached_liquid_class_params(liquid_type, pipette_type):
+    """Look up liquid class parameters once per (liquid_type, pipette_type)"""
+    if get_liquid_class_params is None:
+        print(f"Warning: Could not import liquid_classes module: {_LIQUID_CLASSES_IMPORT_ERROR}")
+        return get_default_liquid_params(pipette_type, liquid_type)
 
+    try:
         # Convert string types to enums
         pipette_enum = PipetteType[pipette_type]
         liquid_enum = LiquidType[liquid_type]
@@ -27,22 +73,21 @@ def get_liquid_class_params_from_module(liquid_type, pipette_type="P1000"):
         params = get_liquid_class_params(pipette_enum, liquid_enum)
 
         if params:
-            return {
-                "aspiration_rate": params.aspiration_rate,
-                "aspiration_delay": params.aspiration_delay,
-                "aspiration_withdrawal_rate": params.aspiration_withdrawal_rate,
-                "dispense_rate": params.dispense_rate,
-                "dispense_delay": params.dispense_delay,
-                "blowout_rate": params.blowout_rate,
-                "touch_tip": params.touch_tip,
-            }
+            return MappingProxyType(
+                {
+                    "aspiration_rate": params.aspiration_rate,
+                    "aspiration_delay": params.aspiration_delay,
+                    "aspiration_withdrawal_rate": params.aspiration_withdrawal_rate,
+                    "dispense_rate": params.dispense_rate,
+                    "dispense_delay": params.dispense_delay,
+                    "blowout_rate": params.blowout_rate,
+                    "touch_tip": params.touch_tip,
+                }
+            )
         else:
             # Fallback to default parameters if not found
             return get_default_liquid_params(pipette_type, liquid_type)
 
-    except ImportError as e:
-        print(f"Warning: Could not import liquid_classes module: {e}")
-        return get_default_liquid_params(pipette_type, liquid_type)
     except Exception as e:
         print(f"Warning: Error getting liquid class parameters: {e}")
         return get_default_liquid_params(pipette_type, liquid_type)
@@ -67,8 +112,37 @@ def get_optimization_strategy_factory():
         return None
 
 
+# Custom parameters that take numeric values
+_FLOAT_PARAM_KEYS = frozenset(
+    [
+        "aspiration_rate",
+        "aspiration_delay",
+        "aspiration_withdrawal_rate",
+        "dispense_rate",
+        "dispense_delay",
+        "blowout_rate",
+    ]
+)
+
+# Accepted spellings of boolean custom parameter values
+_BOOLEAN_VALUES = {
+    "true": True,
+    "yes": True,
+    "1": True,
+    "on": True,
+    "false": False,
+    "no": False,
+    "0": False,
+    "off": False,
+}
+
+
 def parse_custom_params(custom_params_str):
-    """Parse custom liquid class parameters from command line string"""
+    """
+    Parse custom liquid class parameters from command line string
+
+    Returns a read-only mapping, so the parsed parameters can be shared between runs.
+    """
     if not custom_params_str:
         return None
 
@@ -82,22 +156,13 @@ def parse_custom_params(custom_params_str):
                 value = value.strip()
 
                 # Convert value to appropriate type
-                if key in [
-                    "aspiration_rate",
-                    "aspiration_delay",
-                    "aspiration_withdrawal_rate",
-                    "dispense_rate",
-                    "dispense_delay",
-                    "blowout_rate",
-                ]:
+                if key in _FLOAT_PARAM_KEYS:
                     params[key] = float(value)
                 elif key == "touch_tip":
                     # Handle boolean values
-                    if value.lower() in ["true", "yes", "1", "on"]:
-                        params[key] = True
-                    elif value.lower() in ["false", "no", "0", "off"]:
-                        params[key] = False
-                    else:
+                    try:
+                        params[key] = _BOOLEAN_VALUES[value.lower()]
+                    except KeyError:
                         raise ValueError(f"Invalid boolean value for {key}: {value}")
                 else:
                     raise ValueError(f"Unknown parameter: {key}")
@@ -105,56 +170,67 @@ def parse_custom_params(custom_params_str):
     except Exception as e:
         raise ValueError(f"Error parsing custom parameters: {e}")
 
-    return params
+    return MappingProxyType(params)
+
+
+# Base fallback parameters by pipette type
+_BASE_LIQUID_PARAMS = {
+    "P20": {
+        "aspiration_rate": 5.0,
+        "aspiration_delay": 1.0,
+        "aspiration_withdrawal_rate": 5.0,
+        "dispense_rate": 5.0,
+        "dispense_delay": 1.0,
+        "blowout_rate": 1.0,
+        "touch_tip": False,
+    },
+    "P50": {
+        "aspiration_rate": 10.0,
+        "aspiration_delay": 1.0,
+        "aspiration_withdrawal_rate": 5.0,
+        "dispense_rate": 10.0,
+        "dispense_delay": 1.0,
+        "blowout_rate": 5.0,
+        "touch_tip": False,
+    },
+    "P300": {
+        "aspiration_rate": 50.0,
+        "aspiration_delay": 1.0,
+        "aspiration_withdrawal_rate": 5.0,
+        "dispense_rate": 50.0,
+        "dispense_delay": 1.0,
+        "blowout_rate": 10.0,
+        "touch_tip": False,
+    },
+    "P1000": {
+        "aspiration_rate": 150.0,
+        "aspiration_delay": 1.0,
+        "aspiration_withdrawal_rate": 5.0,
+        "dispense_rate": 150.0,
+        "dispense_delay": 1.0,
+        "blowout_rate": 100.0,
+        "touch_tip": True,
+    },
+}
+
+# Liquids whose fallback parameters use slower flow rates and touch tip
+_VOLATILE_LIQUIDS = frozenset(["DMSO", "ETHANOL", "SANITIZER_62_ALCOHOL"])
 
 
 def get_default_liquid_params(pipette_type, liquid_type):
-    """Fallback default parameters if liquid class lookup fails"""
-
-    # Base parameters by pipette type
-    base_params = {
-        "P20": {
-            "aspiration_rate": 5.0,
-            "aspiration_delay": 1.0,
-            "aspiration_withdrawal_rate": 5.0,
-            "dispense_rate": 5.0,
-            "dispense_delay": 1.0,
-            "blowout_rate": 1.0,
-            "touch_tip": False,
-        },
-        "P50": {
-            "aspiration_rate": 10.0,
-            "aspiration_delay": 1.0,
-            "aspiration_withdrawal_rate": 5.0,
-            "dispense_rate": 10.0,
-            "dispense_delay": 1.0,
-            "blowout_rate": 5.0,
-            "touch_tip": False,
-        },
-        "P300": {
-            "aspiration_rate": 50.0,
-            "aspiration_delay": 1.0,
-            "aspiration_withdrawal_rate": 5.0,
-            "dispense_rate": 50.0,
-            "dispense_delay": 1.0,
-            "blowout_rate": 10.0,
-            "touch_tip": False,
-        },
-        "P1000": {
-            "aspiration_rate": 150.0,
-            "aspiration_delay": 1.0,
-            "aspiration_withdrawal_rate": 5.0,
-            "dispense_rate": 150.0,
-            "dispense_delay": 1.0,
-            "blowout_rate": 100.0,
-            "touch_tip": True,
-        },
-    }
+    """Fallback default parameters if liquid class lookup fails (read-only mapping)"""
+    params = _DEFAULT_LIQUID_PARAMS.get((pipette_type, liquid_type))
+    if params is None:
+        params = MappingProxyType(_build_default_liquid_params(pipette_type, liquid_type))
+    return params
+
 
-    params = base_params.get(pipette_type, base_params["P1000"]).copy()
+def _build_default_liquid_params(pipette_type, liquid_type):
+    """Build the fallback parameters for one pipette and liquid type"""
+    params = _BASE_LIQUID_PARAMS.get(pipette_type, _BASE_LIQUID_PARAMS["P1000"]).copy()
 
     # Adjust for volatile liquids
-    if liquid_type in ["DMSO", "ETHANOL", "SANITIZER_62_ALCOHOL"]:
+    if liquid_type in _VOLATILE_LIQUIDS:
         params["aspiration_rate"] *= 0.7
         params["dispense_rate"] *= 0.7
         params["blowout_rate"] *= 0.5
@@ -163,6 +239,86 @@ def get_default_liquid_params(pipette_type, liquid_type):
     return params
 
 
+# Fallback parameters for every known (pipette, liquid) combination, built once at import
+_DEFAULT_LIQUID_PARAMS = {
+    (pipette_type, liquid_type): MappingProxyType(
+        _build_default_liquid_params(pipette_type, liquid_type)
+    )
+    for pipette_type in _BASE_LIQUID_PARAMS
+    for liquid_type in LIQUID_TYPES
+}
+
+
+# Detection flag lines as they can appear in the protocol source
+_DETECTION_SIMULATED = "USE_REAL_DETECTION = False  # Set to False for simulation mode"
+_DETECTION_REAL = "USE_REAL_DETECTION = True  # Set to True for real detection"
+_DETECTION_DEFAULT = "USE_REAL_DETECTION = True  # Set to False for simulation mode"
+
+# Every literal rewritten by _apply_runtime_defaults; the capturing group makes
+# re.split keep the matched literals in the protocol template
+_RUNTIME_DEFAULTS_RE = re.compile(
+    "(%s)"
+    % "|".join(
+        re.escape(literal)
+        for literal in (
+            'default="GLYCEROL_99"',
+            "default=96",
+            'default="simultaneous"',
+            _DETECTION_SIMULATED,
+            _DETECTION_DEFAULT,
+        )
+    )
+)
+
+# LiquidType member references to rewrite as member-name strings: comparisons against
+# LIQUID_TYPE and the keys of the protocol's color table (an indented member followed
+# by a colon); other indented members, e.g. in multi-line calls or lists, are left alone
+_LIQUID_ENUM_RE = re.compile(
+    r"(?P<prefix>LIQUID_TYPE == |^(?P<key>    ))LiquidType\.(?P<name>[A-Z0-9_]+)\b(?(key)(?=:))",
+    re.MULTILINE,
+)
+
+
+def _stringify_liquid_enums(content):
+    """Replace LiquidType member references with their names as string literals"""
+    return _LIQUID_ENUM_RE.sub(lambda match: f"{match['prefix']}'{match['name']}'", content)
+
+
+def _apply_runtime_defaults(
+    template, liquid_type, sample_count, optimization_strategy, use_real_detection
+):
+    """Fill a protocol template with the runtime parameter defaults and detection flag"""
+    substitutions = {
+        'default="GLYCEROL_99"': f'default="{liquid_type}"',
+        "default=96": f"default={sample_count}",
+        'default="simultaneous"': f'default="{optimization_strategy}"',
+    }
+    if use_real_detection:
+        substitutions[_DETECTION_SIMULATED] = _DETECTION_REAL
+    else:
+        substitutions[_DETECTION_DEFAULT] = _DETECTION_SIMULATED
+
+    # Odd positions hold the rewritable literals, even positions the text between them
+    pieces = list(template)
+    for i in range(1, len(pieces), 2):
+        pieces[i] = substitutions.get(pieces[i], pieces[i])
+    return "".join(pieces)
+
+
+@lru_cache(maxsize=4)
+def _read_protocol_template(path, mtime):
+    """
+    Return a protocol source split around its rewritable runtime defaults
+
+    The file is read, has its LiquidType references stringified and is split once
+    per (path, mtime), so edits to the protocol are picked up.
+    """
+    content = Path(path).read_bytes().decode("utf-8")
+    # Enum comparisons and color table keys become strings in every generated protocol,
+    # so they are rewritten once here rather than on every run
+    return tuple(_RUNTIME_DEFAULTS_RE.split(_stringify_liquid_enums(content)))
+
+
 def create_modified_protocol(
     liquid_type="GLYCEROL_50",
     sample_count=96,
@@ -172,101 +328,113 @@ def create_modified_protocol(
     optimization_strategy="simultaneous",
 ):
     """Create a modified protocol file with the specified parameters"""
+    return _create_modified_protocol(
+        Path("protocols/single_channel.py"),
+        "protocol",
+        liquid_type,
+        sample_count,
+        export_temp,
+        use_real_detection,
+        custom_params,
+        optimization_strategy,
+    )
 
+
+def _create_modified_protocol(
+    protocol_path,
+    output_prefix,
+    liquid_type,
+    sample_count,
+    export_temp,
+    use_real_detection,
+    custom_params,
+    optimization_strategy,
+):
+    """Write a copy of a protocol with the specified parameters; returns its path"""
     # Read the original protocol
-    protocol_path = Path("protocols/single_channel.py")
     if not protocol_path.exists():
-        print("Error: protocols/single_channel.py not found")
+        print(f"Error: {protocol_path.as_posix()} not found")
         return None
 
-    with open(protocol_path, "r") as f:
-        content = f.read()
+    content = _render_protocol(
+        str(protocol_path),
+        protocol_path.stat().st_mtime,
+        liquid_type,
+        sample_count,
+        export_temp,
+        use_real_detection,
+        tuple(sorted(custom_params.items())) if custom_params else None,
+        optimization_strategy,
+    )
 
-    # Create a file with modified parameters
+    # Create a file with modified parameters; the buffered writer passes the whole
+    # payload straight to the OS, retrying any short write
     if export_temp:
         # Create in current directory with descriptive name
-        output_filename = f"protocol_{liquid_type}_{sample_count}samples.py"
-        temp_file = open(output_filename, "w")
+        output_path = f"{output_prefix}_{liquid_type}_{sample_count}samples.py"
+        fd = os.open(output_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
     else:
         # Create temporary file in system temp directory
-        temp_file = tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False)
+        fd, output_path = tempfile.mkstemp(suffix=".py")
 
-    # Replace the default values in the protocol
-    modified_content = (
-        content.replace('default="GLYCEROL_99"', f'default="{liquid_type}"')
-        .replace("default=96", f"default={sample_count}")
-        .replace('default="simultaneous"', f'default="{optimization_strategy}"')
-    )
+    with open(fd, "wb") as output_file:
+        output_file.write(content)
 
-    # Set the detection flag based on use_real_detection parameter
-    if use_real_detection:
-        modified_content = modified_content.replace(
-            "USE_REAL_DETECTION = False  # Set to False for simulation mode",
-            "USE_REAL_DETECTION = True  # Set to True for real detection",
-        )
-    else:
-        modified_content = modified_content.replace(
-            "USE_REAL_DETECTION = True  # Set to False for simulation mode",
-            "USE_REAL_DETECTION = False  # Set to False for simulation mode",
-        )
+    return output_path
+
+
+@lru_cache(maxsize=64)
+def _render_protocol(
+    path,
+    mtime,
+    liquid_type,
+    sample_count,
+    export_temp,
+    use_real_detection,
+    custom_params_items,
+    optimization_strategy,
+):
+    """
+    Generate the encoded source of a modified protocol
+
+    Cached per protocol (path, mtime) and parameter set, so repeated runs of the same
+    configuration only write the cached bytes to a new file. Custom parameters are
+    passed as sorted (key, value) items to keep the arguments hashable.
+    """
+    template = _read_protocol_template(path, mtime)
+
+    # Replace the default values and set the detection flag in the protocol
+    modified_content = _apply_runtime_defaults(
+        template, liquid_type, sample_count, optimization_strategy, use_real_detection
+    )
 
     # Handle custom parameters if provided
-    if custom_params:
+    if custom_params_items:
         modified_content = _inject_custom_liquid_params(
-            modified_content, liquid_type, custom_params, export_temp
+            modified_content, liquid_type, dict(custom_params_items), export_temp
         )
     elif export_temp:
         modified_content = _inject_hardcoded_liquid_params(
             modified_content, liquid_type, export_temp
         )
 
-    # Replace enum comparisons with string comparisons
-    for liquid in [
-        "GLYCEROL_10",
-        "GLYCEROL_50",
-        "GLYCEROL_90",
-        "GLYCEROL_99",
-        "PEG_8000_50",
-        "SANITIZER_62_ALCOHOL",
-        "TWEEN_20_100",
-        "ENGINE_OIL_100",
-        "WATER",
-        "DMSO",
-        "ETHANOL",
-    ]:
-        modified_content = modified_content.replace(
-            f"LIQUID_TYPE == LiquidType.{liquid}", f"LIQUID_TYPE == '{liquid}'"
-        )
-
-    temp_file.write(modified_content)
-    temp_file.close()
+    return modified_content.encode("utf-8")
 
-    return temp_file.name
 
-
-def _inject_custom_liquid_params(content, liquid_type, custom_params, export_temp=False):
-    """Inject custom liquid parameters into protocol content"""
-    # Merge with defaults for any missing parameters
-    default_params = get_liquid_class_params_from_module(liquid_type)
-    if default_params:
-        for key, value in default_params.items():
-            if key not in custom_params:
-                custom_params[key] = value
-
-    # Create hardcoded function with custom parameters
-    hardcoded_function = f'''
+# Source of the functions injected into protocols with hardcoded liquid parameters
+_HARDCODED_FUNCTION_TEMPLATE = '''
 # flake8: noqa: E272,E202
 
 def get_hardcoded_liquid_class_params():
-    """Hardcoded liquid class parameters for {liquid_type} (custom)"""
+    """Hardcoded liquid class parameters for {description}"""
     return {{
-        "aspiration_rate": {custom_params["aspiration_rate"]},
-        "aspiration_delay": {custom_params["aspiration_delay"]},
-        "aspiration_withdrawal_rate": {custom_params["aspiration_withdrawal_rate"]},
-        "dispense_rate": {custom_params["dispense_rate"]},
-        "dispense_delay": {custom_params["dispense_delay"]},
-        "blowout_rate": {custom_params["blowout_rate"]},
-        "touch_tip": {custom_params["touch_tip"]}
+        "aspiration_rate": {params[aspiration_rate]},
+        "aspiration_delay": {params[aspiration_delay]},
+        "aspiration_withdrawal_rate": {params[aspiration_withdrawal_rate]},
+        "dispense_rate": {params[dispense_rate]},
+        "dispense_delay": {params[dispense_delay]},
+        "blowout_rate": {params[blowout_rate]},
+        "touch_tip": {params[touch_tip]}
     }}
 
 def get_default_liquid_class_params(pipette, liquid):
@@ -275,7 +443,17 @@ def get_default_liquid_class_params(pipette, liquid):
     return get_hardcoded_liquid_class_params()
 '''
 
-    return _inject_liquid_params_into_content(content, hardcoded_function, liquid_type, export_temp)
+
+def _inject_custom_liquid_params(content, liquid_type, custom_params, export_temp=False):
+    """Inject custom liquid parameters into protocol content"""
+    # Merge with defaults for any missing parameters, leaving the caller's dict untouched
+    default_params = get_liquid_class_params_from_module(liquid_type)
+    if default_params:
+        custom_params = {**default_params, **custom_params}
+
+    return _inject_params(
+        content, liquid_type, custom_params, f"{liquid_type} (custom)", export_temp
+    )
 
 
 def _inject_hardcoded_liquid_params(content, liquid_type, export_temp=False):
@@ -286,31 +464,104 @@ def _inject_hardcoded_liquid_params(content, liquid_type, export_temp=False):
     if not liquid_params:
         return content
 
-    # Create hardcoded function
-    hardcoded_function = f'''
-# flake8: noqa: E272,E202
+    return _inject_params(content, liquid_type, liquid_params, liquid_type, export_temp)
 
-def get_hardcoded_liquid_class_params():
-    """Hardcoded liquid class parameters for {liquid_type}"""
-    return {{
-        "aspiration_rate": {liquid_params["aspiration_rate"]},
-        "aspiration_delay": {liquid_params["aspiration_delay"]},
-        "aspiration_withdrawal_rate": {liquid_params["aspiration_withdrawal_rate"]},
-        "dispense_rate": {liquid_params["dispense_rate"]},
-        "dispense_delay": {liquid_params["dispense_delay"]},
-        "blowout_rate": {liquid_params["blowout_rate"]},
-        "touch_tip": {liquid_params["touch_tip"]}
-    }}
-
-def get_default_liquid_class_params(pipette, liquid):
-    """Simplified default liquid class parameters for exported protocol"""
-    # Return the hardcoded parameters since we don't need the complex logic
-    return get_hardcoded_liquid_class_params()
-'''
 
+def _inject_params(content, liquid_type, params, description, export_temp=False):
+    """Inject a hardcoded parameter function built from params into protocol content"""
+    hardcoded_function = _HARDCODED_FUNCTION_TEMPLATE.format(description=description, params=params)
     return _inject_liquid_params_into_content(content, hardcoded_function, liquid_type, export_temp)
 
 
+# Top-level anchors for the export-path edits, located in a single scan: the metadata
+# block, and the function definitions that bound the protocol's defaults section
+_SECTION_ANCHORS_RE = re.compile(
+    r"^(?:(?P<metadata>metadata = \{)"
+    r"|(?P<defaults>def get_default_liquid_class_params\([^)]*\)\s*->\s*LiquidClassParams:\s*\n)"
+    r"|(?P<add_parameters>def add_parameters\()"
+    r"|def )",
+    re.MULTILINE,
+)
+
+
+def _find_section_anchors(content):
+    """
+    Locate the metadata block and the defaults section in one pass
+
+    Returns:
+        (metadata_start, defaults_start, defaults_end); the starts are -1 when missing.
+        The defaults section ends at add_parameters, else at the next top-level def,
+        else at the end of the file.
+    """
+    metadata_start = defaults_start = -1
+    add_parameters_start = next_def_start = -1
+    for match in _SECTION_ANCHORS_RE.finditer(content):
+        if match["metadata"] is not None:
+            if metadata_start == -1:
+                metadata_start = match.start()
+        elif match["defaults"] is not None:
+            if defaults_start == -1:
+                defaults_start = match.start()
+        elif defaults_start != -1:
+            if match["add_parameters"] is not None:
+                add_parameters_start = match.start()
+                break
+            if next_def_start == -1:
+                next_def_start = match.start()
+
+    if add_parameters_start != -1:
+        defaults_end = add_parameters_start
+    elif next_def_start != -1:
+        defaults_end = next_def_start
+    else:
+        defaults_end = len(content)
+    return metadata_start, defaults_start, defaults_end
+
+
+# Fixed source rewrites applied when liquid parameters are hardcoded into a protocol
+_EXPORT_TOKEN_EDITS = {
+    # Replace the pipette type conversion
+    "PIPETTE_TYPE = PipetteType[protocol.params.pipette_type]  # type: ignore": (
+        "PIPETTE_TYPE = 'P1000'  # Hardcoded pipette type"
+    ),
+    # Replace the get_liquid_class_params call with the hardcoded function
+    "get_liquid_class_params(PIPETTE_TYPE, LIQUID_TYPE)": "get_hardcoded_liquid_class_params()",
+    # Replace references to .value attributes since we're using strings now
+    "PIPETTE_TYPE.value": "PIPETTE_TYPE",
+    "LIQUID_TYPE.value": "LIQUID_TYPE",
+    # Replace the .to_dict() call since we're returning a dict directly
+    "liquid_class_params.to_dict()": "liquid_class_params",
+}
+
+# Rewrites whose replacement depends on the run
+_LIQUID_TYPE_CONVERSION = "LIQUID_TYPE = LiquidType[protocol.params.liquid_type]  # type: ignore"
+_STRATEGIES_IMPORT = (
+    "from optimization_strategies import OptimizationStrategyFactory, OptimizationStrategy"
+)
+_DYNAMIC_STRATEGIES_IMPORT = (
+    "import sys\n"
+    "import os\n"
+    "from pathlib import Path\n"
+    "# Add the project root (where protocols/ is located) to sys.path\n"
+    "project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))\n"
+    "if project_root not in sys.path:\n"
+    "    sys.path.insert(0, project_root)\n"
+    "from protocols.optimization_strategies import OptimizationStrategyFactory, OptimizationStrategy"
+)
+
+# Longest tokens first so no token is shadowed by one of its prefixes
+_EXPORT_TOKEN_RE = re.compile(
+    "|".join(
+        re.escape(token)
+        for token in sorted(
+            [*_EXPORT_TOKEN_EDITS, _LIQUID_TYPE_CONVERSION, _STRATEGIES_IMPORT],
+            key=len,
+            reverse=True,
+        )
+    )
+)
+
+
 def _inject_liquid_params_into_content(content, hardcoded_function, liquid_type, export_temp=False):
     """Common function to inject liquid parameters into protocol content"""
     # Remove the liquid class imports
@@ -322,77 +573,82 @@ def _inject_liquid_params_into_content(content, hardcoded_function, liquid_type,
         "    LiquidClassParams,\n"
         ")"
     )
-    content = content.replace(
-        import_string,
-        "# Liquid class imports removed - using hardcoded values",
-    )
+    # Structural edits are collected as (start, end, replacement) spans and applied in
+    # a single pass, so the protocol source is only rebuilt once
+    span_edits = []
+    import_start = content.find(import_string)
+    if import_start != -1:
+        span_edits.append(
+            (
+                import_start,
+                import_start + len(import_string),
+                "# Liquid class imports removed - using hardcoded values",
+            )
+        )
+
+    import_end, defaults_start, defaults_end = _find_section_anchors(content)
 
     # Add the hardcoded function after the imports section
-    import_end = content.find("metadata = {")
     if import_end != -1:
-        content = content[:import_end] + hardcoded_function + "\n\n" + content[import_end:]
-
-    # Replace the liquid type conversion in the run function
-    content = content.replace(
-        "LIQUID_TYPE = LiquidType[protocol.params.liquid_type]  # type: ignore",
-        f"LIQUID_TYPE = '{liquid_type}'  # Hardcoded liquid type",
-    )
+        span_edits.append((import_end, import_end, hardcoded_function + "\n\n"))
 
-    # Replace the pipette type conversion
-    content = content.replace(
-        "PIPETTE_TYPE = PipetteType[protocol.params.pipette_type]  # type: ignore",
-        "PIPETTE_TYPE = 'P1000'  # Hardcoded pipette type",
-    )
+    # Remove the original get_default_liquid_class_params function, together with
+    # the rest of the defaults section (its helpers and lookup table)
+    if defaults_start != -1:
+        span_edits.append((defaults_start, defaults_end, ""))
 
-    # Replace the get_liquid_class_params call with the hardcoded function
-    content = content.replace(
-        "get_liquid_class_params(PIPETTE_TYPE, LIQUID_TYPE)",
-        "get_hardcoded_liquid_class_params()",
-    )
+    content = _apply_span_edits(content, span_edits)
 
-    # Replace references to .value attributes since we're using strings now
-    content = content.replace("PIPETTE_TYPE.value", "PIPETTE_TYPE")
-    content = content.replace("LIQUID_TYPE.value", "LIQUID_TYPE")
+    # Rewrite enum conversions and accesses in a single scan
+    edits = dict(_EXPORT_TOKEN_EDITS)
+    edits[_LIQUID_TYPE_CONVERSION] = f"LIQUID_TYPE = '{liquid_type}'  # Hardcoded liquid type"
+    # For temporary files, the optimization strategies import needs the project root
+    # on sys.path - the same pattern as liquids
+    edits[_STRATEGIES_IMPORT] = _STRATEGIES_IMPORT if export_temp else _DYNAMIC_STRATEGIES_IMPORT
+    content = _EXPORT_TOKEN_RE.sub(lambda match: edits[match.group(0)], content)
 
-    # Replace the .to_dict() call since we're returning a dict directly
-    content = content.replace("liquid_class_params.to_dict()", "liquid_class_params")
-
-    # Handle optimization strategies import for temporary files
-    if not export_temp:
-        # For temporary files, we need to handle the optimization strategies import
-        # Use the same pattern as liquids - add current directory to sys.path
-        dynamic_import = (
-            "import sys\n"
-            "import os\n"
-            "from pathlib import Path\n"
-            "# Add the project root (where protocols/ is located) to sys.path\n"
-            "project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))\n"
-            "if project_root not in sys.path:\n"
-            "    sys.path.insert(0, project_root)\n"
-            "from protocols.optimization_strategies import OptimizationStrategyFactory, OptimizationStrategy"
-        )
-        content = content.replace(
-            "from optimization_strategies import OptimizationStrategyFactory, OptimizationStrategy",
-            dynamic_import,
-        )
+    return content
 
-    # Replace the original get_default_liquid_class_params function
-    # Find the start and end of the original function
-    original_func_start = content.find(
-        "def get_default_liquid_class_params("
-        "pipette: PipetteType, liquid: LiquidType) -> LiquidClassParams:"
-    )
-    if original_func_start != -1:
-        # Find the end of the function (next function definition)
-        next_func_start = content.find("def ", original_func_start + 1)
-        if next_func_start != -1:
-            # Replace the entire original function
-            content = content[:original_func_start] + content[next_func_start:]
-        else:
-            # If no next function, just remove from start to end of file
-            content = content[:original_func_start]
 
-    return content
+def _apply_span_edits(content, span_edits):
+    """Apply non-overlapping (start, end, replacement) edits to content in one pass"""
+    pieces = []
+    position = 0
+    for start, end, replacement in sorted(span_edits):
+        pieces.append(content[position:start])
+        pieces.append(replacement)
+        position = end
+    pieces.append(content[position:])
+    return "".join(pieces)
+
+
+# Messages to skip in non-verbose mode
+_SKIP_MESSAGES = (
+    "robot_settings.json not found",
+    "Loading defaults",
+    "Belt calibration not found",
+    "Using default robot settings",
+    "Robot settings loaded",
+)
+
+# Messages to highlight in verbose mode
+_HIGHLIGHT_MESSAGES = (
+    "Protocol simulation completed",
+    "Protocol completed successfully",
+    "Error:",
+    "Warning:",
+    "INFO:",
+    "DEBUG:",
+)
+
+# Whole-buffer patterns: a skipped line together with its newline, and the start of
+# every highlighted line
+_SKIP_LINES_RE = re.compile(
+    r"^[^\n]*(?:%s)[^\n]*(?:\n|\Z)" % "|".join(map(re.escape, _SKIP_MESSAGES)), re.MULTILINE
+)
+_HIGHLIGHT_LINES_RE = re.compile(
+    r"^(?=[^\n]*(?:%s))" % "|".join(map(re.escape, _HIGHLIGHT_MESSAGES)), re.MULTILINE
+)
 
 
 def filter_output(output, verbose=False):
@@ -400,40 +656,54 @@ def filter_output(output, verbose=False):
     if not output:
         return ""
 
-    lines = output.split("\n")
-    filtered_lines = []
+    # Skip unwanted messages unless verbose
+    if not verbose:
+        return _SKIP_LINES_RE.sub("", output)
 
-    # Messages to skip in non-verbose mode
-    skip_messages = [
-        "robot_settings.json not found",
-        "Loading defaults",
-        "Belt calibration not found",
-        "Using default robot settings",
-        "Robot settings loaded",
-    ]
+    # Highlight important messages in verbose mode
+    return _HIGHLIGHT_LINES_RE.sub("  ", output)
 
-    # Messages to highlight in verbose mode
-    highlight_messages = [
-        "Protocol simulation completed",
-        "Protocol completed successfully",
-        "Error:",
-        "Warning:",
-        "INFO:",
-        "DEBUG:",
-    ]
 
-    for line in lines:
-        # Skip unwanted messages unless verbose
-        if not verbose and any(skip_msg in line for skip_msg in skip_messages):
-            continue
+def _print_filtered(output, header, verbose=False, quiet=False):
+    """Print filtered output under a header, if anything is left after filtering"""
+    filtered = filter_output(output, verbose)
+    if filtered.strip() and not quiet:
+        print(header)
+        print(filtered)
 
-        # Highlight important messages in verbose mode
-        if verbose and any(highlight_msg in line for highlight_msg in highlight_messages):
-            filtered_lines.append(f"  {line}")
-        else:
-            filtered_lines.append(line)
 
-    return "\n".join(filtered_lines)
+def _run_simulator(temp_protocol, verbose=False, quiet=False):
+    """
+    Simulate a protocol in-process, printing filtered output; returns the exit code
+
+    Mirrors the opentrons_simulate command line tool, but reuses the already-imported
+    Opentrons stack instead of starting a new interpreter for every simulation.
+    """
+    stdout, stderr = io.StringIO(), io.StringIO()
+    returncode = 0
+    with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+        try:
+            # Imported lazily so listing liquids or showing parameters stays fast; a
+            # missing or broken Opentrons install fails the simulation like any other error
+            from opentrons.simulate import format_runlog, simulate
+            from opentrons.util.entrypoint_util import ProtocolEngineExecuteError
+
+            try:
+                with open(temp_protocol, "rb") as protocol_file:
+                    runlog, _ = simulate(protocol_file, file_name=temp_protocol)
+                print(format_runlog(runlog))
+            except ProtocolEngineExecuteError as error:
+                print(error.to_stderr_string(), file=sys.stderr)
+                returncode = 1
+        except Exception:
+            traceback.print_exc()
+            returncode = 1
+
+    _print_filtered(stdout.getvalue(), "Simulation Output:", verbose, quiet)
+    # Errors are printed even when quiet, which only suppresses non-error output
+    _print_filtered(stderr.getvalue(), "Simulation Errors:", verbose)
+
+    return returncode
 
 
 def run_simulation(
@@ -473,30 +743,14 @@ def run_simulation(
         return False
 
     try:
-        # Run the simulation
-        result = subprocess.run(
-            ["opentrons_simulate", temp_protocol], capture_output=True, text=True
-        )
-
-        # Filter and print output
-        if result.stdout:
-            filtered_stdout = filter_output(result.stdout, verbose)
-            if filtered_stdout.strip():
-                if not quiet:
-                    print("Simulation Output:")
-                    print(filtered_stdout)
-
-        if result.stderr:
-            filtered_stderr = filter_output(result.stderr, verbose)
-            if filtered_stderr.strip():
-                if not quiet:
-                    print("Simulation Errors:")
-                    print(filtered_stderr)
+        # Run the simulation in-process; its captured output is filtered and printed
+        # once it finishes
+        returncode = _run_simulator(temp_protocol, verbose, quiet)
 
         if verbose and not quiet:
-            print(f"Simulation completed with return code: {result.returncode}")
+            print(f"Simulation completed with return code: {returncode}")
 
-        return result.returncode == 0
+        return returncode == 0
 
     finally:
         # Clean up temporary file unless export is requested
@@ -519,67 +773,17 @@ def create_modified_8channel_protocol(
     optimization_strategy="simultaneous",
 ):
     """Create a modified 8channel protocol file with the specified parameters"""
-    protocol_path = Path("protocols/eight_channel.py")
-    if not protocol_path.exists():
-        print("Error: protocols/eight_channel.py not found")
-        return None
-    with open(protocol_path, "r") as f:
-        content = f.read()
-    if export_temp:
-        output_filename = f"protocol_8channel_single_{liquid_type}_{sample_count}samples.py"
-        temp_file = open(output_filename, "w")
-    else:
-        temp_file = tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False)
-    modified_content = (
-        content.replace('default="GLYCEROL_99"', f'default="{liquid_type}"')
-        .replace("default=96", f"default={sample_count}")
-        .replace('default="simultaneous"', f'default="{optimization_strategy}"')
+    return _create_modified_protocol(
+        Path("protocols/eight_channel.py"),
+        "protocol_8channel_single",
+        liquid_type,
+        sample_count,
+        export_temp,
+        use_real_detection,
+        custom_params,
+        optimization_strategy,
     )
 
-    # Set the detection flag based on use_real_detection parameter
-    if use_real_detection:
-        modified_content = modified_content.replace(
-            "USE_REAL_DETECTION = False  # Set to False for simulation mode",
-            "USE_REAL_DETECTION = True  # Set to True for real detection",
-        )
-    else:
-        modified_content = modified_content.replace(
-            "USE_REAL_DETECTION = True  # Set to False for simulation mode",
-            "USE_REAL_DETECTION = False  # Set to False for simulation mode",
-        )
-
-    # Handle custom parameters if provided
-    if custom_params:
-        modified_content = _inject_custom_liquid_params(
-            modified_content, liquid_type, custom_params, export_temp
-        )
-    elif export_temp:
-        modified_content = _inject_hardcoded_liquid_params(
-            modified_content, liquid_type, export_temp
-        )
-
-    # Replace enum comparisons with string comparisons
-    for liquid in [
-        "GLYCEROL_10",
-        "GLYCEROL_50",
-        "GLYCEROL_90",
-        "GLYCEROL_99",
-        "PEG_8000_50",
-        "SANITIZER_62_ALCOHOL",
-        "TWEEN_20_100",
-        "ENGINE_OIL_100",
-        "WATER",
-        "DMSO",
-        "ETHANOL",
-    ]:
-        modified_content = modified_content.replace(
-            f"LIQUID_TYPE == LiquidType.{liquid}", f"LIQUID_TYPE == '{liquid}'"
-        )
-
-    temp_file.write(modified_content)
-    temp_file.close()
-    return temp_file.name
-
 
 def run_simulation_8channel(
     liquid_type="GLYCEROL_50",
@@ -615,26 +819,12 @@ def run_simulation_8channel(
     if not temp_protocol:
         return False
     try:
-        result = subprocess.run(
-            ["opentrons_simulate", temp_protocol], capture_output=True, text=True
-        )
-        if result.stdout:
-            filtered_stdout = filter_output(result.stdout, verbose)
-            if filtered_stdout.strip():
-                if not quiet:
-                    print("Simulation Output:")
-                    print(filtered_stdout)
-        if result.stderr:
-            filtered_stderr = filter_output(result.stderr, verbose)
-            if filtered_stderr.strip():
-                if not quiet:
-                    print("Simulation Errors:")
-                    print(filtered_stderr)
+        returncode = _run_simulator(temp_protocol, verbose, quiet)
 
         if verbose and not quiet:
-            print(f"8-channel simulation completed with return code: {result.returncode}")
+            print(f"8-channel simulation completed with return code: {returncode}")
 
-        return result.returncode == 0
+        return returncode == 0
     finally:
         if not export_temp:
             try:
@@ -646,6 +836,119 @@ def run_simulation_8channel(
                 print(f"\nTemporary 8channel protocol file exported to: {temp_protocol}")
 
 
+def parse_batch_file(batch_path):
+    """
+    Parse a batch file of simulation configurations
+
+    Each non-blank line holds a liquid type and a sample count separated by
+    whitespace; lines starting with '#' are comments.
+    """
+    configs = []
+    with open(batch_path) as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.split("#", 1)[0].strip()
+            if not line:
+                continue
+
+            fields = line.split()
+            if len(fields) != 2:
+                raise ValueError(
+                    f"Line {line_number}: expected 'LIQUID_TYPE SAMPLE_COUNT', got '{line}'"
+                )
+
+            liquid_type = fields[0].upper()
+            if liquid_type not in VALID_LIQUIDS:
+                raise ValueError(f"Line {line_number}: invalid liquid type '{fields[0]}'")
+            try:
+                sample_count = int(fields[1])
+            except ValueError:
+                raise ValueError(f"Line {line_number}: invalid sample count '{fields[1]}'")
+            if sample_count < 1 or sample_count > 96:
+                raise ValueError(f"Line {line_number}: sample count must be between 1 and 96")
+
+            configs.append((liquid_type, sample_count))
+
+    return configs
+
+
+def _run_batch_config(runner, liquid_type, sample_count, **kwargs):
+    """
+    Run one batch configuration quietly in a worker process
+
+    Returns the success flag and the captured output, which in quiet mode only
+    holds error messages.
+    """
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+        success = runner(liquid_type, sample_count, quiet=True, **kwargs)
+    return success, output.getvalue()
+
+
+def run_batch(
+    configs,
+    workers=None,
+    optimization_strategy="simultaneous",
+    mode_8channel=False,
+    export_temp=False,
+    custom_params=None,
+):
+    """
+    Run independent simulations in parallel worker processes
+
+    Args:
+        configs: List of (liquid_type, sample_count) tuples
+        workers: Number of worker processes (default: one per config, up to os.cpu_count())
+        optimization_strategy: Optimization strategy used for every run
+        mode_8channel: Run the 8-channel protocol instead of the single-channel one
+        export_temp: Export every generated protocol file instead of deleting it
+        custom_params: Custom liquid class parameters used for every run
+
+    Returns:
+        List of (success, errors) tuples, in the same order as configs; errors holds
+        the error output of a failed run, or the exception that stopped its worker
+    """
+    if not configs:
+        return []
+
+    runner = run_simulation_8channel if mode_8channel else run_simulation
+    # Read-only mappings cannot be pickled for the worker processes
+    custom_params = dict(custom_params) if custom_params else None
+    max_workers = workers or min(len(configs), os.cpu_count() or 1)
+    results = []
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        # Workers run quietly so their output does not interleave
+        futures = [
+            executor.submit(
+                _run_batch_config,
+                runner,
+                liquid_type,
+                sample_count,
+                export_temp=export_temp,
+                custom_params=custom_params,
+                optimization_strategy=optimization_strategy,
+            )
+            for liquid_type, sample_count in configs
+        ]
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                # A crashed worker fails its own config instead of the whole batch
+                results.append((False, "".join(traceback.format_exception(e))))
+    return results
+
+
+def _sample_count(value):
+    """argparse type for the sample count: an integer between 1 and 96"""
+    try:
+        sample_count = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid sample count '{value}'")
+    if sample_count < 1 or sample_count > 96:
+        raise argparse.ArgumentTypeError("sample count must be between 1 and 96")
+    return sample_count
+
+
 def main():
     """Main function to handle command-line arguments"""
     parser = argparse.ArgumentParser(
@@ -679,6 +982,12 @@ EXAMPLES:
   # Custom parameters with 8-channel mode
   python run_simulation.py DMSO 24 --8channel --custom-params "aspiration_rate=50,aspiration_delay=2.0"
 
+  # Run every configuration in a batch file in parallel
+  python run_simulation.py --batch configs.txt
+
+  # Sweep all liquid types in parallel (12 samples each, 8-channel mode)
+  python run_simulation.py --all-liquids 12 --8channel
+
 AVAILABLE LIQUID TYPES:
   GLYCEROL_10, GLYCEROL_50, GLYCEROL_90, GLYCEROL_99
   PEG_8000_50, SANITIZER_62_ALCOHOL, TWEEN_20_100
@@ -693,13 +1002,16 @@ For more information, visit: https://github.com/LiquidLib/custom_liquid_class_fi
     parser.add_argument(
         "liquid_type",
         nargs="?",
+        type=str.upper,
+        choices=LIQUID_TYPES,
         default="GLYCEROL_50",
+        metavar="LIQUID_TYPE",
         help="Liquid type to use for simulation (default: GLYCEROL_50)",
     )
     parser.add_argument(
         "sample_count",
         nargs="?",
-        type=int,
+        type=_sample_count,
         default=8,
         help="Number of samples to process (1-96, default: 8)",
     )
@@ -707,6 +1019,7 @@ For more information, visit: https://github.com/LiquidLib/custom_liquid_class_fi
     # Mode options
     parser.add_argument(
         "--8channel",
+        dest="mode_8channel",
         action="store_true",
         help="Run simulation in 8-channel mode (default: single-channel)",
     )
@@ -763,6 +1076,22 @@ For more information, visit: https://github.com/LiquidLib/custom_liquid_class_fi
         help="Optimization strategy to use (default: simultaneous)",
     )
 
+    # Batch mode
+    parser.add_argument(
+        "--batch",
+        metavar="FILE",
+        help="Run the configurations listed in FILE in parallel, "
+        "one 'LIQUID_TYPE SAMPLE_COUNT' per line",
+    )
+    parser.add_argument(
+        "--all-liquids",
+        nargs="?",
+        type=_sample_count,
+        const=8,
+        metavar="SAMPLE_COUNT",
+        help="Run every liquid type in parallel with SAMPLE_COUNT samples (default: 8)",
+    )
+
     # Information options
     parser.add_argument("--version", action="version", version="custom-liquid-class-finder 0.1.0")
 
@@ -777,45 +1106,60 @@ For more information, visit: https://github.com/LiquidLib/custom_liquid_class_fi
         show_liquid_params(args.show_params.upper())
         return 0
 
-    # Validate arguments
-    liquid_type = args.liquid_type.upper()
+    mode_8channel = args.mode_8channel
+
+    if args.batch or args.all_liquids:
+        # Batch workers run quietly and always use simulated detection
+        for option, enabled in (
+            ("--verbose", args.verbose),
+            ("--real-detection", args.real_detection),
+        ):
+            if enabled:
+                parser.error(f"{option} is not supported with --batch or --all-liquids")
+
+        custom_params = None
+        if args.custom_params:
+            try:
+                custom_params = parse_custom_params(args.custom_params)
+            except ValueError as e:
+                print(f"Error: {e}")
+                return 1
+
+        if args.all_liquids:
+            configs = [(liquid_type, args.all_liquids) for liquid_type in LIQUID_TYPES]
+        else:
+            try:
+                configs = parse_batch_file(args.batch)
+            except (OSError, ValueError) as e:
+                print(f"Error: {e}")
+                return 1
+
+        results = run_batch(
+            configs,
+            optimization_strategy=args.optimization_strategy,
+            mode_8channel=mode_8channel,
+            export_temp=args.export,
+            custom_params=custom_params,
+        )
+        for (liquid_type, sample_count), (success, errors) in zip(configs, results):
+            print(f"{'PASS' if success else 'FAIL'}  {liquid_type} {sample_count}")
+            if not success and errors.strip():
+                print(textwrap.indent(errors.rstrip(), "    "))
+        return 0 if all(success for success, _ in results) else 1
+
+    liquid_type = args.liquid_type
     sample_count = args.sample_count
     export_temp = args.export
-    mode_8channel = args.__dict__["8channel"]
     verbose = args.verbose
     quiet = args.quiet
 
-    valid_liquids = [
-        "GLYCEROL_10",
-        "GLYCEROL_50",
-        "GLYCEROL_90",
-        "GLYCEROL_99",
-        "PEG_8000_50",
-        "SANITIZER_62_ALCOHOL",
-        "TWEEN_20_100",
-        "ENGINE_OIL_100",
-        "WATER",
-        "DMSO",
-        "ETHANOL",
-    ]
-
-    if liquid_type not in valid_liquids:
-        print(f"Error: Invalid liquid type '{liquid_type}'")
-        print(f"Available types: {', '.join(valid_liquids)}")
-        print("Use --list-liquids to see detailed descriptions")
-        return 1
-
-    if sample_count < 1 or sample_count > 96:
-        print("Error: Sample count must be between 1 and 96")
-        return 1
-
     # Parse custom parameters if provided
     custom_params = None
     if args.custom_params:
         try:
             custom_params = parse_custom_params(args.custom_params)
             if verbose and not quiet:
-                print(f"Custom parameters parsed: {custom_params}")
+                print(f"Custom parameters parsed: {dict(custom_params)}")
         except ValueError as e:
             print(f"Error: {e}")
             return 1
@@ -832,7 +1176,7 @@ For more information, visit: https://github.com/LiquidLib/custom_liquid_class_fi
         print(f"  Detection: {'Real' if use_real_detection else 'Simulated'}")
         print(f"  Export: {'Yes' if export_temp else 'No'}")
         if custom_params:
-            print(f"  Custom Parameters: {custom_params}")
+            print(f"  Custom Parameters: {dict(custom_params)}")
         print()
 
     if mode_8channel:
@@ -861,34 +1205,21 @@ For more information, visit: https://github.com/LiquidLib/custom_liquid_class_fi
 
 def print_liquid_types():
     """Print all available liquid types with descriptions"""
-    liquid_descriptions = {
-        "GLYCEROL_10": "Glycerol 10% - Low viscosity aqueous solution",
-        "GLYCEROL_50": "Glycerol 50% - Medium viscosity aqueous solution",
-        "GLYCEROL_90": "Glycerol 90% - High viscosity aqueous solution",
-        "GLYCEROL_99": "Glycerol 99% - Very high viscosity solution",
-        "PEG_8000_50": "PEG 8000 50% w/v - Polyethylene glycol solution",
-        "SANITIZER_62_ALCOHOL": "Sanitizer 62% Alcohol - Volatile alcohol solution",
-        "TWEEN_20_100": "Tween 20 100% - Surfactant solution",
-        "ENGINE_OIL_100": "Engine oil 100% - High viscosity oil",
-        "WATER": "Water - Standard aqueous solution",
-        "DMSO": "DMSO - Dimethyl sulfoxide, volatile organic solvent",
-        "ETHANOL": "Ethanol - Volatile alcohol",
-    }
-
     print("Available Liquid Types:")
     print("=" * 50)
-    for liquid, description in liquid_descriptions.items():
+    for liquid, description in LIQUID_DESCRIPTIONS.items():
         print(f"{liquid:<20} - {description}")
     print("\nUse --show-params LIQUID_TYPE to see detailed parameters")
 
 
 def show_liquid_params(liquid_type):
     """Show liquid class parameters for a specific liquid type"""
-    try:
-        # Import the liquid classes module
-        sys.path.insert(0, str(Path.cwd()))
-        from liquids.liquid_classes import get_liquid_class_params, PipetteType, LiquidType
+    if get_liquid_class_params is None:
+        print(f"Error: Could not import liquid_classes module: {_LIQUID_CLASSES_IMPORT_ERROR}")
+        print("Make sure you're running from the correct directory")
+        return
 
+    try:
         if liquid_type not in [lt.name for lt in LiquidType]:
             print(f"Error: Unknown liquid type '{liquid_type}'")
             print("Use --list-liquids to see available types")
@@ -915,9 +1246,6 @@ def show_liquid_params(liquid_type):
             else:
                 print(f"\n{pipette_name} Pipette: No parameters available")
 
-    except ImportError as e:
-        print(f"Error: Could not import liquid_classes module: {e}")
-        print("Make sure you're running from the correct directory")
     except Exception as e:
         print(f"Error: {e}")
 
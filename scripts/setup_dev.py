@@ -2,18 +2,36 @@
 """
 Development environment setup script for Liquid Class Finder
 """
+
+import hashlib
 import os
+import shutil
 import sys
 import subprocess
 import venv
 from pathlib import Path
 
+# Child processes skip user site-packages scanning, .pyc writes and pip's
+# version check / prompts, none of which the setup steps need
+CHILD_ENV = {
+    **os.environ,
+    "PYTHONDONTWRITEBYTECODE": "1",
+    "PYTHONNOUSERSITE": "1",
+    "PIP_DISABLE_PIP_VERSION_CHECK": "1",
+    "PIP_NO_INPUT": "1",
+}
+
+# Hash of pyproject.toml from the last successful install into .venv
+DEPS_STAMP = Path(".venv/.deps-hash")
+
 
 def run_command(cmd, check=True, shell=True):
     """Run a shell command and handle errors"""
     print(f"Running: {cmd}")
     try:
-        result = subprocess.run(cmd, shell=shell, check=check, capture_output=True, text=True)
+        result = subprocess.run(
+            cmd, shell=shell, check=check, capture_output=True, text=True, env=CHILD_ENV
+        )
         if result.stdout:
             print(result.stdout)
         return result
@@ -26,6 +44,33 @@ def run_command(cmd, check=True, shell=True):
         return e
 
 
+def install_dependencies(python_path):
+    """Install the package with dev extras and the pre-commit hooks into the venv
+
+    Uses uv when it is on PATH, falling back to pip. If $WHEELHOUSE names a
+    directory of prebuilt wheels, packages are installed from it without
+    touching the package index.
+    """
+    wheelhouse = os.environ.get("WHEELHOUSE")
+    index_args = ["--no-index", "--find-links", wheelhouse] if wheelhouse else []
+
+    uv_path = shutil.which("uv")
+    if uv_path:
+        print("📦 Installing dependencies with uv and pre-commit hooks...")
+        run_command(
+            [uv_path, "pip", "install", "--python", python_path, "-e", ".[dev]", *index_args],
+            shell=False,
+        )
+    else:
+        print("📦 Upgrading pip, installing dependencies and pre-commit hooks...")
+        # One pip run upgrades pip and installs the package with its dev extras
+        run_command(
+            [python_path, "-m", "pip", "install", "--upgrade", "pip", "-e", ".[dev]", *index_args],
+            shell=False,
+        )
+    run_command([python_path, "-m", "pre_commit", "install"], shell=False)
+
+
 def setup_development_environment():
     """Set up the complete development environment"""
     print("🚀 Setting up Liquid Class Finder development environment...")
@@ -48,34 +93,31 @@ def setup_development_environment():
 
     # Determine activation script
     if os.name == "nt":  # Windows
-        pip_path = ".venv/Scripts/pip"
         python_path = ".venv/Scripts/python"
     else:  # Unix/Linux/macOS
-        pip_path = ".venv/bin/pip"
         python_path = ".venv/bin/python"
 
-    # Upgrade pip
-    print("⬆️  Upgrading pip...")
-    run_command(f"{pip_path} install --upgrade pip")
-
-    # Install dependencies
-    print("📦 Installing dependencies...")
-    run_command(f"{pip_path} install -e '.[dev]'")
-
-    # Install pre-commit hooks
-    print("🔧 Installing pre-commit hooks...")
-    run_command(f"{python_path} -m pre_commit install")
-
-    print("\n🎉 Development environment setup complete!")
-    print("\nNext steps:")
-    print("1. Activate the virtual environment:")
-    if os.name == "nt":
-        print("   .venv\\Scripts\\activate")
+    # Install dependencies and pre-commit hooks, unless
+    # pyproject.toml is unchanged since the last install
+    deps_hash = hashlib.sha256(Path("pyproject.toml").read_bytes()).hexdigest()
+    if DEPS_STAMP.exists() and DEPS_STAMP.read_text() == deps_hash:
+        print("✅ Dependencies already up to date")
     else:
-        print("   source .venv/bin/activate")
-    print("2. Run tests: make test")
-    print("3. Check code quality: make check")
-    print("4. Start developing!")
+        install_dependencies(python_path)
+        DEPS_STAMP.write_text(deps_hash)
+
+    # Closing summary is written in one go rather than line by line
+    activate = ".venv\\Scripts\\activate" if os.name == "nt" else "source .venv/bin/activate"
+    summary = [
+        "\n🎉 Development environment setup complete!",
+        "\nNext steps:",
+        "1. Activate the virtual environment:",
+        f"   {activate}",
+        "2. Run tests: make test",
+        "3. Check code quality: make check",
+        "4. Start developing!",
+    ]
+    sys.stdout.write("\n".join(summary) + "\n")
 
 
 if __name__ == "__main__":
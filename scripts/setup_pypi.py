@@ -4,16 +4,31 @@ Setup script for PyPI publishing preparation.
 This script helps validate the package before publishing.
 """
 
+import argparse
+import os
 import sys
 import subprocess
+from collections import defaultdict
+from functools import partial
 from pathlib import Path
 
+# Same child environment as scripts/setup_dev.py
+CHILD_ENV = {
+    **os.environ,
+    "PYTHONDONTWRITEBYTECODE": "1",
+    "PYTHONNOUSERSITE": "1",
+    "PIP_DISABLE_PIP_VERSION_CHECK": "1",
+    "PIP_NO_INPUT": "1",
+}
+
 
 def run_command(cmd, description):
     """Run a command and handle errors."""
     print(f"\n🔄 {description}...")
     try:
-        result = subprocess.run(cmd, shell=True, check=True, capture_output=True, text=True)
+        result = subprocess.run(
+            cmd, shell=True, check=True, capture_output=True, text=True, env=CHILD_ENV
+        )
         print(f"✅ {description} completed successfully")
         if result.stdout:
             print(result.stdout)
@@ -25,9 +40,104 @@ def run_command(cmd, description):
         return False
 
 
-def check_file_exists(filepath, description):
+def run_in_process(check, description):
+    """Run a check in this interpreter and handle errors.
+
+    The check is a callable returning a process-style exit code (0 on success).
+    Any exception it raises, including SystemExit, counts as a failed check.
+    """
+    print(f"\n🔄 {description}...")
+    try:
+        exit_code = check()
+    except (Exception, SystemExit) as e:
+        print(f"❌ {description} failed:")
+        print(f"Error: {e!r}")
+        return False
+    if exit_code:
+        print(f"❌ {description} failed with exit code {int(exit_code)}")
+        return False
+    print(f"✅ {description} completed successfully")
+    return True
+
+
+def changed_python_files():
+    """List Python files changed since HEAD~1, or None if git cannot tell.
+
+    Diffing the working tree against HEAD~1 covers both uncommitted edits and
+    the last commit, so checking right after committing still sees its files.
+    New files that are not tracked yet are listed too.
+    """
+    git_commands = [
+        ["git", "diff", "--name-only", "HEAD~1", "--", "*.py"],
+        ["git", "ls-files", "--others", "--exclude-standard", "--", "*.py"],
+    ]
+    paths = []
+    try:
+        for cmd in git_commands:
+            result = subprocess.run(cmd, check=True, capture_output=True, text=True)
+            paths.extend(result.stdout.splitlines())
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    # Deleted files show up in the diff but have nothing left to check
+    return [path for path in dict.fromkeys(paths) if Path(path).exists()]
+
+
+def check_formatting(paths):
+    """Check code formatting with black."""
+    import black
+
+    return black.main(["--check", *paths], standalone_mode=False)
+
+
+def check_linting(paths):
+    """Lint the given paths with flake8."""
+    from flake8.api import legacy
+
+    style_guide = legacy.get_style_guide(max_line_length=100, extend_ignore=["E203", "W503"])
+    total_errors = style_guide.check_files(paths).total_errors
+    if total_errors:
+        print(f"flake8 found {total_errors} error(s)")
+        return 1
+    return 0
+
+
+def check_types(paths):
+    """Type check the given paths with mypy."""
+    from mypy import api
+
+    stdout, stderr, exit_code = api.run(["--ignore-missing-imports", *paths])
+    print(stdout, end="")
+    print(stderr, end="", file=sys.stderr)
+    return exit_code
+
+
+def run_tests():
+    """Run the test suite with coverage, spread across all cores by pytest-xdist."""
+    import pytest
+
+    return pytest.main(["-n", "auto", "--cov=liquids", "--cov-report=term-missing"])
+
+
+def find_existing_files(filepaths):
+    """Return the subset of filepaths that exist, listing each directory only once."""
+    names_by_dir = defaultdict(set)
+    for filepath in filepaths:
+        path = Path(filepath)
+        names_by_dir[path.parent].add(path.name)
+
+    existing = set()
+    for directory, names in names_by_dir.items():
+        try:
+            with os.scandir(directory) as entries:
+                existing.update(directory / e.name for e in entries if e.name in names)
+        except OSError:
+            continue
+    return existing
+
+
+def check_file_exists(filepath, description, existing_files):
     """Check if a file exists."""
-    if Path(filepath).exists():
+    if Path(filepath) in existing_files:
         print(f"✅ {description}: {filepath}")
         return True
     else:
@@ -37,6 +147,16 @@ def check_file_exists(filepath, description):
 
 def main():
     """Main setup function."""
+    parser = argparse.ArgumentParser(description="Validate the package before publishing")
+    parser.add_argument(
+        "--all",
+        "--full",
+        dest="all",
+        action="store_true",
+        help="Check the whole tree instead of only Python files changed since HEAD~1",
+    )
+    args = parser.parse_args()
+
     print("🚀 PyPI Publishing Setup")
     print("=" * 50)
 
@@ -50,9 +170,10 @@ def main():
         ("liquids/__init__.py", "Package init file"),
     ]
 
+    existing_files = find_existing_files(filepath for filepath, _ in required_files)
     all_files_exist = True
     for filepath, description in required_files:
-        if not check_file_exists(filepath, description):
+        if not check_file_exists(filepath, description, existing_files):
             all_files_exist = False
 
     if not all_files_exist:
@@ -62,21 +183,27 @@ def main():
     # Run quality checks
     checks_passed = True
 
-    # Check code formatting
-    if not run_command("black --check .", "Code formatting check"):
-        checks_passed = False
-
-    # Check linting
-    if not run_command("flake8 --max-line-length=100 --extend-ignore=E203,W503 .", "Linting check"):
-        checks_passed = False
-
-    # Check type hints
-    if not run_command("mypy --ignore-missing-imports .", "Type checking"):
-        checks_passed = False
-
-    # Run tests
-    if not run_command("pytest --cov=liquids --cov-report=term-missing", "Test suite"):
-        checks_passed = False
+    # Static checks only look at Python files changed since HEAD~1 unless --all
+    # is given (or git is unavailable), and are skipped when none changed.
+    # mypy always checks the whole tree, since a change can break callers elsewhere
+    paths = None if args.all else changed_python_files()
+    if paths == []:
+        print("\n⏭️  No Python files changed since HEAD~1, skipping static checks")
+        checks = []
+    else:
+        paths = paths or ["."]
+        checks = [
+            (partial(check_formatting, paths), "Code formatting check"),
+            (partial(check_linting, paths), "Linting check"),
+            (partial(check_types, ["."]), "Type checking"),
+        ]
+    checks.append((run_tests, "Test suite"))
+
+    # Formatting, linting, type checking and tests share this interpreter,
+    # so their startup and imports are only paid once
+    for check, description in checks:
+        if not run_in_process(check, description):
+            checks_passed = False
 
     # Build package
     if not run_command("python -m build", "Package build"):
@@ -87,11 +214,13 @@ def main():
         checks_passed = False
 
     if checks_passed:
-        print("\n🎉 All checks passed! Package is ready for publishing.")
-        print("\n📦 To publish to TestPyPI:")
-        print("   twine upload --repository testpypi dist/*")
-        print("\n📦 To publish to PyPI:")
-        print("   twine upload dist/*")
+        print(
+            "\n🎉 All checks passed! Package is ready for publishing.\n"
+            "\n📦 To publish to TestPyPI:\n"
+            "   twine upload --repository testpypi dist/*\n"
+            "\n📦 To publish to PyPI:\n"
+            "   twine upload dist/*"
+        )
     else:
         print("\n❌ Some checks failed. Please fix the issues before publishing.")
         sys.exit(1)
@@ -9,6 +9,7 @@ correctly with the reference data provided by the user.
 import unittest
 from liquids.liquid_classes import (
     LiquidClassParams,
+    LiquidClassRegistry,
     PipetteType,
     LiquidType,
     liquid_class_registry,
@@ -21,15 +22,19 @@ from liquids.liquid_classes import (
 class TestLiquidClasses(unittest.TestCase):
     """Test cases for the liquid class system"""
 
+    @classmethod
+    def setUpClass(cls):
+        """Build the default registry once for the whole class"""
+        cls._default_registry = LiquidClassRegistry()
+
     def setUp(self):
         """Set up test fixtures"""
-        # Clear the registry for each test
-        liquid_class_registry._liquid_classes.clear()
-        liquid_class_registry._initialize_default_classes()
+        # Each test works on its own copy of the default registry, never the global one
+        self.registry = self._default_registry.copy()
 
     def test_glycerol_p1000_reference_data(self):
         """Test that the glycerol P1000 reference data is correctly loaded"""
-        params = get_liquid_class_params(PipetteType.P1000, LiquidType.GLYCEROL_99)
+        params = get_liquid_class_params(PipetteType.P1000, LiquidType.GLYCEROL_99, self.registry)
 
         self.assertIsNotNone(params)
         self.assertEqual(params.pipette, PipetteType.P1000)
@@ -44,7 +49,7 @@ class TestLiquidClasses(unittest.TestCase):
 
     def test_csv_export(self):
         """Test CSV export functionality"""
-        csv_data = export_liquid_classes_csv()
+        csv_data = export_liquid_classes_csv(self.registry)
 
         # Check that CSV contains the expected header
         self.assertIn("Pipette,Liquid,Aspiration Rate (µL/s)", csv_data)
@@ -55,7 +60,7 @@ class TestLiquidClasses(unittest.TestCase):
     def test_csv_import(self):
         """Test CSV import functionality"""
         # Clear registry
-        liquid_class_registry._liquid_classes.clear()
+        self.registry._liquid_classes.clear()
 
         # Test CSV data
         test_csv = (
@@ -66,17 +71,35 @@ class TestLiquidClasses(unittest.TestCase):
         )
 
         # Import the CSV
-        import_liquid_classes_from_csv(test_csv)
+        import_liquid_classes_from_csv(test_csv, self.registry)
 
         # Verify the data was imported correctly
-        params = get_liquid_class_params(PipetteType.P1000, LiquidType.GLYCEROL_99)
+        params = get_liquid_class_params(PipetteType.P1000, LiquidType.GLYCEROL_99, self.registry)
         self.assertIsNotNone(params)
         self.assertEqual(params.aspiration_rate, 41.175)
         self.assertEqual(params.dispense_rate, 19.215)
 
+    def test_csv_round_trip(self):
+        """Test that exported CSV, including a liquid name with a comma, imports back"""
+        self.registry._liquid_classes.clear()
+        import_liquid_classes_from_csv(
+            "Pipette,Liquid,Aspiration Rate (µL/s),Aspiration Delay (s),"
+            "Aspiration Withdrawal Rate (mm/s),Dispense Rate (µL/s),"
+            "Dispense Delay (s),Blowout Rate (µL/s),Touch tip\n"
+            'P300,"Tris, 50 mM",80.0,0.5,5.0,80.0,0.5,40.0,Yes',
+            self.registry,
+        )
+        csv_data = export_liquid_classes_csv(self.registry)
+        self.assertIn('P300,"Tris, 50 mM",80.0,0.5,5.0,80.0,0.5,40.0,Yes', csv_data)
+
+        reimported = LiquidClassRegistry()
+        reimported._liquid_classes.clear()
+        import_liquid_classes_from_csv(csv_data, reimported)
+        self.assertEqual(export_liquid_classes_csv(reimported), csv_data)
+
     def test_to_dict_conversion(self):
         """Test conversion to dictionary format"""
-        params = get_liquid_class_params(PipetteType.P1000, LiquidType.GLYCEROL_99)
+        params = get_liquid_class_params(PipetteType.P1000, LiquidType.GLYCEROL_99, self.registry)
         param_dict = params.to_dict()
 
         expected_keys = {
@@ -95,7 +118,7 @@ class TestLiquidClasses(unittest.TestCase):
 
     def test_string_representation(self):
         """Test string representation of liquid class parameters"""
-        params = get_liquid_class_params(PipetteType.P1000, LiquidType.GLYCEROL_99)
+        params = get_liquid_class_params(PipetteType.P1000, LiquidType.GLYCEROL_99, self.registry)
         param_str = str(params)
 
         # Check that the string contains the expected values
@@ -107,7 +130,7 @@ class TestLiquidClasses(unittest.TestCase):
 
     def test_nonexistent_liquid_class(self):
         """Test behavior when requesting non-existent liquid class"""
-        params = get_liquid_class_params(PipetteType.P50, LiquidType.DMSO)
+        params = get_liquid_class_params(PipetteType.P50, LiquidType.DMSO, self.registry)
         self.assertIsNone(params)
 
     def test_add_new_liquid_class(self):
@@ -126,10 +149,10 @@ class TestLiquidClasses(unittest.TestCase):
         )
 
         # Add to registry
-        liquid_class_registry.add_liquid_class(new_params)
+        self.registry.add_liquid_class(new_params)
 
         # Verify it was added
-        retrieved_params = get_liquid_class_params(PipetteType.P300, LiquidType.DMSO)
+        retrieved_params = get_liquid_class_params(PipetteType.P300, LiquidType.DMSO, self.registry)
         self.assertIsNotNone(retrieved_params)
         self.assertEqual(retrieved_params.aspiration_rate, 75.0)
         self.assertEqual(retrieved_params.touch_tip, True)
@@ -139,14 +162,14 @@ class TestLiquidClasses(unittest.TestCase):
         invalid_csv = "Invalid,CSV,Format"
 
         with self.assertRaises(ValueError):
-            import_liquid_classes_from_csv(invalid_csv)
+            import_liquid_classes_from_csv(invalid_csv, self.registry)
 
     def test_empty_csv(self):
         """Test handling of empty CSV"""
         empty_csv = ""
 
         with self.assertRaises(ValueError):
-            import_liquid_classes_from_csv(empty_csv)
+            import_liquid_classes_from_csv(empty_csv, self.registry)
 
     def test_csv_with_invalid_values(self):
         """Test handling of CSV with invalid numeric values"""
@@ -158,7 +181,7 @@ class TestLiquidClasses(unittest.TestCase):
         )
 
         with self.assertRaises(ValueError):
-            import_liquid_classes_from_csv(invalid_csv)
+            import_liquid_classes_from_csv(invalid_csv, self.registry)
 
 
 def run_demo():
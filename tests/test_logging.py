@@ -4,133 +4,199 @@ Test script to demonstrate the enhanced logging output
 that will appear in the simulation log during optimization.
 """
 
-
-def simulate_protocol_logging():
-    """Simulate the logging output that would appear in the protocol"""
-
-    print("=" * 60)
-    print("LIQUID CLASS OPTIMIZATION STARTED")
-    print("=" * 60)
-    print("Testing 10 wells with P1000 pipette")
-    print("Liquid type: GLYCEROL_99")
-    print(
-        "Reference parameters: {'aspiration_rate': 150.0, 'aspiration_delay': 1.0, "
-        "'aspiration_withdrawal_rate': 5.0, 'dispense_rate': 150.0, "
-        "'dispense_delay': 1.0, 'blowout_rate': 100.0}"
+import io
+import sys
+
+SEP = "=" * 60
+
+_PARAM_KEYS = (
+    "aspiration_rate",
+    "aspiration_delay",
+    "aspiration_withdrawal_rate",
+    "dispense_rate",
+    "dispense_delay",
+    "blowout_rate",
+)
+
+# Simulated scores per well: previous/current scores shown during gradient
+# descent, and the final score of each well
+_PREVIOUS_SCORES = tuple(round(3.0 - i * 0.2, 3) for i in range(5))
+_CURRENT_SCORES = tuple(round(2.8 - i * 0.2, 3) for i in range(5))
+_FINAL_SCORES = tuple(round(3.097 - i * 0.2, 3) for i in range(5))
+
+# Evaluation breakdown logged (unchanged) for every well
+_EVALUATION_BREAKDOWN = "\n".join(
+    [
+        "  Evaluation breakdown:",
+        "    Aspiration factor: 0.778 (contribution: 0.444)",
+        "    Dispense factor: 0.778 (contribution: 0.444)",
+        "    Blowout factor: 0.009 (contribution: 1.486)",
+        "    Delay factor: 1.000 (contribution: 0.500)",
+        "    Base score: 2.874",
+        "    Noise: +0.123",
+        "    Edge penalty: 0.100",
+        "    Final score: 3.097",
+    ]
+)
+
+# Log block for each gradient-descent well; only the scores vary between wells
+_GRADIENT_BLOCK_TEMPLATE = "\n".join(
+    [
+        "Previous scores: {previous_score:.3f} -> {current_score:.3f}",
+        "Calculated gradients: {{'aspiration_rate': -0.1, 'dispense_rate': -0.1, "
+        "'blowout_rate': -0.05}}",
+        "Learning rate: 0.1000",
+        "Parameter changes:",
+        "  aspiration_rate: 151.00 -> 150.90 (Δ-0.10)",
+        "  dispense_rate: 151.00 -> 150.90 (Δ-0.10)",
+        "  blowout_rate: 100.50 -> 100.45 (Δ-0.05)",
+    ]
+)
+
+# Closing analysis banner; it does not depend on the simulated wells, so the
+# whole block is built once
+_FINAL_ANALYSIS = "\n".join(
+    [
+        "\n" + SEP,
+        "OPTIMIZATION COMPLETE - FINAL ANALYSIS",
+        SEP,
+        "🏆 OPTIMAL PARAMETERS FOUND IN: A3",
+        "🏆 OPTIMAL BUBBLICITY SCORE: 2.697",
+        "🏆 OPTIMAL PARAMETERS:",
+        "    aspiration_rate: 150.70",
+        "    aspiration_delay: 1.00",
+        "    aspiration_withdrawal_rate: 5.00",
+        "    dispense_rate: 150.70",
+        "    dispense_delay: 1.00",
+        "    blowout_rate: 100.35",
+        "\n📊 PARAMETER COMPARISON (Reference → Optimal):",
+        "    aspiration_rate: 150.00 → 150.70 (Δ+0.70, +0.5%)",
+        "    dispense_rate: 150.00 → 150.70 (Δ+0.70, +0.5%)",
+        "    blowout_rate: 100.00 → 100.35 (Δ+0.35, +0.4%)",
+        "\n📈 OPTIMIZATION STATISTICS:",
+        "    Total wells tested: 5",
+        "    Successful height checks: 5",
+        "    Success rate: 100.0%",
+        "    Final learning rate: 0.1000",
+        "    Best score achieved: 2.697",
+        "    Total improvement: 0.400 (+12.9%)",
+        "    Recent score variance: 0.0123",
+        "    ✅ Algorithm appears to have converged",
+        "\n📉 SCORE PROGRESSION:",
+        "    Initial score: 3.097",
+        "    Final score: 2.697",
+        "    Major improvements: 1",
+        "      Iteration 1: +0.400",
+        "\n" + SEP,
+        "LIQUID CLASS CALIBRATION PROTOCOL COMPLETED",
+        SEP,
+    ]
+)
+
+
+def simulate_protocol_logging(write=None):
+    """Simulate the logging output that would appear in the protocol
+
+    The log is written in one call to write, which defaults to sys.stdout.write.
+    """
+    write = write or sys.stdout.write
+    lines = []
+
+    lines.extend(
+        [
+            SEP,
+            "LIQUID CLASS OPTIMIZATION STARTED",
+            SEP,
+            "Testing 10 wells with P1000 pipette",
+            "Liquid type: GLYCEROL_99",
+            "Reference parameters: {'aspiration_rate': 150.0, 'aspiration_delay': 1.0, "
+            "'aspiration_withdrawal_rate': 5.0, 'dispense_rate': 150.0, "
+            "'dispense_delay': 1.0, 'blowout_rate': 100.0}",
+            "Initial learning rate: 0.1",
+            SEP,
+        ]
     )
-    print("Initial learning rate: 0.1")
-    print("=" * 60)
+
+    # One parameter dict, updated in place for each well
+    current_params = dict.fromkeys(_PARAM_KEYS, 0.0)
 
     # Simulate a few iterations
     for well_idx in range(5):
         well_name = f"A{well_idx + 1}"
-        print(f"\n--- WELL {well_idx + 1}/10: {well_name} ---")
+        lines.append(f"\n--- WELL {well_idx + 1}/10: {well_name} ---")
 
         if well_idx == 0:
-            print("Using reference liquid class parameters for first well")
-            current_params = {
-                "aspiration_rate": 150.0,
-                "aspiration_delay": 1.0,
-                "aspiration_withdrawal_rate": 5.0,
-                "dispense_rate": 150.0,
-                "dispense_delay": 1.0,
-                "blowout_rate": 100.0,
-            }
+            lines.append("Using reference liquid class parameters for first well")
+            current_params.update(
+                aspiration_rate=150.0,
+                aspiration_delay=1.0,
+                aspiration_withdrawal_rate=5.0,
+                dispense_rate=150.0,
+                dispense_delay=1.0,
+                blowout_rate=100.0,
+            )
         elif well_idx == 1:
-            print("Making initial parameter adjustments for exploration:")
-            print("  aspiration_rate: 150.00 -> 151.00 (Δ+1.00)")
-            print("  dispense_rate: 150.00 -> 151.00 (Δ+1.00)")
-            print("  blowout_rate: 100.00 -> 100.50 (Δ+0.50)")
-            current_params = {
-                "aspiration_rate": 151.0,
-                "aspiration_delay": 1.0,
-                "aspiration_withdrawal_rate": 5.0,
-                "dispense_rate": 151.0,
-                "dispense_delay": 1.0,
-                "blowout_rate": 100.5,
-            }
+            lines.extend(
+                [
+                    "Making initial parameter adjustments for exploration:",
+                    "  aspiration_rate: 150.00 -> 151.00 (Δ+1.00)",
+                    "  dispense_rate: 150.00 -> 151.00 (Δ+1.00)",
+                    "  blowout_rate: 100.00 -> 100.50 (Δ+0.50)",
+                ]
+            )
+            current_params.update(aspiration_rate=151.0, dispense_rate=151.0, blowout_rate=100.5)
         else:
-            print(f"Previous scores: {3.0 - well_idx*0.2:.3f} -> {2.8 - well_idx*0.2:.3f}")
-            print(
-                "Calculated gradients: {'aspiration_rate': -0.1, 'dispense_rate': -0.1, "
-                "'blowout_rate': -0.05}"
+            lines.append(
+                _GRADIENT_BLOCK_TEMPLATE.format(
+                    previous_score=_PREVIOUS_SCORES[well_idx],
+                    current_score=_CURRENT_SCORES[well_idx],
+                )
             )
-            print("Learning rate: 0.1000")
-            print("Parameter changes:")
-            print("  aspiration_rate: 151.00 -> 150.90 (Δ-0.10)")
-            print("  dispense_rate: 151.00 -> 150.90 (Δ-0.10)")
-            print("  blowout_rate: 100.50 -> 100.45 (Δ-0.05)")
-            current_params = {
-                "aspiration_rate": 150.9,
-                "aspiration_delay": 1.0,
-                "aspiration_withdrawal_rate": 5.0,
-                "dispense_rate": 150.9,
-                "dispense_delay": 1.0,
-                "blowout_rate": 100.45,
-            }
-
-        print(f"Current parameters: {current_params}")
-        print("Executing dispense sequence...")
-        print("Evaluating liquid height...")
+            current_params.update(aspiration_rate=150.9, dispense_rate=150.9, blowout_rate=100.45)
+
+        lines.extend(
+            [
+                f"Current parameters: {current_params}",
+                "Executing dispense sequence...",
+                "Evaluating liquid height...",
+            ]
+        )
 
         # Simulate evaluation breakdown
-        print("  Evaluation breakdown:")
-        print("    Aspiration factor: 0.778 (contribution: 0.444)")
-        print("    Dispense factor: 0.778 (contribution: 0.444)")
-        print("    Blowout factor: 0.009 (contribution: 1.486)")
-        print("    Delay factor: 1.000 (contribution: 0.500)")
-        print("    Base score: 2.874")
-        print("    Noise: +0.123")
-        print("    Edge penalty: 0.100")
-        print("    Final score: 3.097")
-
-        score = 3.097 - well_idx * 0.2
+        lines.append(_EVALUATION_BREAKDOWN)
+
+        score = _FINAL_SCORES[well_idx]
         if well_idx == 0:
-            print(f"🎉 NEW BEST SCORE: {score:.3f} in {well_name}")
-            print(f"Best parameters so far: {current_params}")
+            lines.extend(
+                [
+                    f"🎉 NEW BEST SCORE: {score:.3f} in {well_name}",
+                    f"Best parameters so far: {current_params}",
+                ]
+            )
         else:
-            print(f"Score: {score:.3f} (no improvement, count: {well_idx})")
+            lines.append(f"Score: {score:.3f} (no improvement, count: {well_idx})")
 
-        print(f"Progress: {well_idx + 1}/10 wells, Best score: {score:.3f}, Learning rate: 0.1000")
+        lines.append(
+            f"Progress: {well_idx + 1}/10 wells, Best score: {score:.3f}, Learning rate: 0.1000"
+        )
 
     # Final analysis
-    print("\n" + "=" * 60)
-    print("OPTIMIZATION COMPLETE - FINAL ANALYSIS")
-    print("=" * 60)
-    print("🏆 OPTIMAL PARAMETERS FOUND IN: A3")
-    print("🏆 OPTIMAL BUBBLICITY SCORE: 2.697")
-    print("🏆 OPTIMAL PARAMETERS:")
-    print("    aspiration_rate: 150.70")
-    print("    aspiration_delay: 1.00")
-    print("    aspiration_withdrawal_rate: 5.00")
-    print("    dispense_rate: 150.70")
-    print("    dispense_delay: 1.00")
-    print("    blowout_rate: 100.35")
-
-    print("\n📊 PARAMETER COMPARISON (Reference → Optimal):")
-    print("    aspiration_rate: 150.00 → 150.70 (Δ+0.70, +0.5%)")
-    print("    dispense_rate: 150.00 → 150.70 (Δ+0.70, +0.5%)")
-    print("    blowout_rate: 100.00 → 100.35 (Δ+0.35, +0.4%)")
-
-    print("\n📈 OPTIMIZATION STATISTICS:")
-    print("    Total wells tested: 5")
-    print("    Successful height checks: 5")
-    print("    Success rate: 100.0%")
-    print("    Final learning rate: 0.1000")
-    print("    Best score achieved: 2.697")
-    print("    Total improvement: 0.400 (+12.9%)")
-    print("    Recent score variance: 0.0123")
-    print("    ✅ Algorithm appears to have converged")
-
-    print("\n📉 SCORE PROGRESSION:")
-    print("    Initial score: 3.097")
-    print("    Final score: 2.697")
-    print("    Major improvements: 1")
-    print("      Iteration 1: +0.400")
-
-    print("\n" + "=" * 60)
-    print("LIQUID CLASS CALIBRATION PROTOCOL COMPLETED")
-    print("=" * 60)
+    lines.append(_FINAL_ANALYSIS)
+
+    write("\n".join(lines) + "\n")
+
+
+def test_simulate_protocol_logging():
+    """Test that the simulated log covers the start, every well and the final analysis"""
+    buffer = io.StringIO()
+    simulate_protocol_logging(buffer.write)
+    output = buffer.getvalue()
+
+    assert output.startswith(SEP + "\nLIQUID CLASS OPTIMIZATION STARTED\n")
+    for well_idx in range(5):
+        assert f"--- WELL {well_idx + 1}/10: A{well_idx + 1} ---" in output
+    assert "🏆 OPTIMAL BUBBLICITY SCORE: 2.697" in output
+    assert output.endswith("LIQUID CLASS CALIBRATION PROTOCOL COMPLETED\n" + SEP + "\n")
 
 
 if __name__ == "__main__":
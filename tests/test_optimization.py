@@ -4,90 +4,88 @@ Test script to demonstrate the improved gradient descent optimization
 for liquid class calibration.
 """
 
-import random
 from typing import Dict
 
+import numpy as np
 
-def simulate_realistic_evaluation(params: Dict[str, float], iteration: int) -> float:
-    """Simulate realistic evaluation results based on parameters"""
-    # Base score that varies with parameters
-    base_score = 0.0
+# Fixed parameter order used for the array representation of a parameter set
+PARAMS = (
+    "aspiration_rate",
+    "aspiration_delay",
+    "aspiration_withdrawal_rate",
+    "dispense_rate",
+    "dispense_delay",
+    "blowout_rate",
+)
+ASPIRATION_RATE, ASPIRATION_DELAY, _, DISPENSE_RATE, DISPENSE_DELAY, BLOWOUT_RATE = range(6)
+
+
+def simulate_realistic_evaluation(params: np.ndarray, noise) -> np.ndarray:
+    """Simulate realistic evaluation results based on parameters
+
+    params holds one parameter set per row (in PARAMS order), so a whole batch of
+    candidates is scored with a handful of array operations; noise broadcasts
+    against the rows.
+    """
+    params = np.asarray(params, dtype=float)
 
     # Parameter effects on score (simulated)
     # Lower aspiration rate generally better for bubble reduction
-    aspiration_factor = max(0.1, 1.0 - (params["aspiration_rate"] - 50) / 450)
-    base_score += (1.0 - aspiration_factor) * 2.0
+    aspiration_factor = np.maximum(0.1, 1.0 - (params[..., ASPIRATION_RATE] - 50) / 450)
+    base_score = (1.0 - aspiration_factor) * 2.0
 
     # Lower dispense rate generally better
-    dispense_factor = max(0.1, 1.0 - (params["dispense_rate"] - 50) / 450)
+    dispense_factor = np.maximum(0.1, 1.0 - (params[..., DISPENSE_RATE] - 50) / 450)
     base_score += (1.0 - dispense_factor) * 2.0
 
     # Moderate blowout rate is optimal
     blowout_optimal = 50.0
-    blowout_factor = 1.0 - abs(params["blowout_rate"] - blowout_optimal) / blowout_optimal
-    base_score += (1.0 - max(0, blowout_factor)) * 1.5
+    blowout_factor = 1.0 - np.abs(params[..., BLOWOUT_RATE] - blowout_optimal) / blowout_optimal
+    base_score += (1.0 - np.maximum(0, blowout_factor)) * 1.5
 
     # Delays can help but too much is bad
-    delay_factor = min(1.0, (params["aspiration_delay"] + params["dispense_delay"]) / 2.0)
+    delay_factor = np.minimum(
+        1.0, (params[..., ASPIRATION_DELAY] + params[..., DISPENSE_DELAY]) / 2.0
+    )
     base_score += delay_factor * 0.5
 
-    # Add some randomness
-    random.seed(iteration)
-    noise = random.uniform(-0.2, 0.2)
+    return np.maximum(0.0, base_score + noise)
 
-    final_score = max(0.0, base_score + noise)
-    return final_score
 
-
-def calculate_gradient_direction(
+def optimization_step(
+    previous_params: np.ndarray,
+    current_params: np.ndarray,
     previous_score: float,
     current_score: float,
-    previous_params: Dict[str, float],
-    current_params: Dict[str, float],
-) -> Dict[str, float]:
-    """Calculate gradient direction for each parameter"""
+    learning_rate: float,
+    gradient_step: np.ndarray,
+    lower: np.ndarray,
+    upper: np.ndarray,
+) -> np.ndarray:
+    """Compute the next parameters from the last two evaluations
+
+    Fuses the finite-difference gradient, the gradient update and the bound
+    constraints into one pass over the parameter array.
+    """
     if previous_score == float("inf"):
-        return {param: 0.0 for param in current_params.keys()}
-
-    gradients = {}
-    for param in current_params.keys():
-        if param in previous_params:
-            param_change = current_params[param] - previous_params[param]
-            if abs(param_change) > 1e-6:
-                score_change = current_score - previous_score
-                gradients[param] = -score_change / param_change
-            else:
-                gradients[param] = 0.0
-        else:
-            gradients[param] = 0.0
-
-    return gradients
+        return np.clip(current_params, lower, upper)
 
+    param_change = current_params - previous_params
+    moved = np.abs(param_change) > 1e-6
+    score_change = current_score - previous_score
+    # Unmoved parameters divide by 1.0 and are then zeroed, avoiding 0/0 warnings
+    gradients = np.where(moved, -score_change / np.where(moved, param_change, 1.0), 0.0)
+    return np.clip(current_params + learning_rate * gradient_step * gradients, lower, upper)
 
-def update_parameters_with_gradient(
-    current_params: Dict[str, float],
-    gradients: Dict[str, float],
-    learning_rate: float,
-    gradient_step: Dict[str, float],
-) -> Dict[str, float]:
-    """Update parameters using calculated gradients"""
-    updated_params = current_params.copy()
-
-    for param, gradient in gradients.items():
-        if param in updated_params:
-            step = learning_rate * gradient_step[param] * gradient
-            updated_params[param] += step
 
-    return updated_params
+def _to_array(values: Dict[str, float]) -> np.ndarray:
+    """Pack a per-parameter dict into an array in PARAMS order"""
+    return np.array([values[param] for param in PARAMS], dtype=float)
 
 
-def apply_constraints(params: Dict[str, float], param_bounds: Dict[str, tuple]) -> Dict[str, float]:
-    """Apply parameter constraints"""
-    constrained_params = params.copy()
-    for param, (min_val, max_val) in param_bounds.items():
-        if param in constrained_params:
-            constrained_params[param] = max(min_val, min(max_val, constrained_params[param]))
-    return constrained_params
+def _to_dict(values: np.ndarray) -> Dict[str, float]:
+    """Unpack an array in PARAMS order into a per-parameter dict"""
+    return dict(zip(PARAMS, values.tolist()))
 
 
 def test_optimization():
@@ -129,28 +127,40 @@ def test_optimization():
     min_learning_rate = 0.01
     patience = 5
 
-    # Initialize
-    current_params = reference_params.copy()
+    # Array form of the above, in PARAMS order
+    lower = _to_array({param: bounds[0] for param, bounds in param_bounds.items()})
+    upper = _to_array({param: bounds[1] for param, bounds in param_bounds.items()})
+    step_sizes = _to_array(gradient_step)
+
+    # Initialize; every update below builds a new array rather than modifying
+    # current_params in place, so best_params can share the reference
+    current_params = _to_array(reference_params)
     best_score = float("inf")
-    best_params = reference_params.copy()
+    best_params = current_params
     learning_rate = initial_learning_rate
     no_improvement_count = 0
 
-    optimization_history = []
-
     print("Testing improved gradient descent optimization...")
     print(f"Initial parameters: {reference_params}")
     print()
 
+    # Evaluation noise for all iterations, drawn in one call
+    n_iterations = 20
+    noise = np.random.default_rng(0).uniform(-0.2, 0.2, size=n_iterations)
+
+    # Score and parameter history, preallocated for the gradient steps
+    scores = np.empty(n_iterations)
+    params_history = np.empty((n_iterations, len(PARAMS)))
+
     # Run optimization for 20 iterations
-    for iteration in range(20):
+    for iteration in range(n_iterations):
         # Evaluate current parameters
-        current_score = simulate_realistic_evaluation(current_params, iteration)
+        current_score = float(simulate_realistic_evaluation(current_params, noise[iteration]))
 
         # Track best result
         if current_score < best_score:
             best_score = current_score
-            best_params = current_params.copy()
+            best_params = current_params
             no_improvement_count = 0
             print(f"Iteration {iteration}: New best score: {best_score:.3f}")
         else:
@@ -163,38 +173,25 @@ def test_optimization():
             print(f"Iteration {iteration}: Reducing learning rate to {learning_rate:.4f}")
 
         # Store history
-        optimization_history.append(
-            {
-                "iteration": iteration,
-                "params": current_params.copy(),
-                "score": current_score,
-                "best_score": best_score,
-                "learning_rate": learning_rate,
-            }
-        )
+        scores[iteration] = current_score
+        params_history[iteration] = current_params
 
         # Update parameters for next iteration
         if iteration > 0:
-            # Calculate gradients
-            gradients = calculate_gradient_direction(
-                optimization_history[iteration - 1]["score"],
-                current_score,
-                optimization_history[iteration - 1]["params"],
+            # Gradient, update and constraints in one step
+            current_params = optimization_step(
+                params_history[iteration - 1],
                 current_params,
+                scores[iteration - 1],
+                current_score,
+                learning_rate,
+                step_sizes,
+                lower,
+                upper,
             )
-
-            # Update parameters
-            current_params = update_parameters_with_gradient(
-                current_params, gradients, learning_rate, gradient_step
-            )
-
-            # Apply constraints
-            current_params = apply_constraints(current_params, param_bounds)
         else:
             # For first iteration, make small random adjustments
-            for param in gradient_step.keys():
-                adjustment = gradient_step[param] * 0.1
-                current_params[param] += adjustment
+            current_params = current_params + step_sizes * 0.1
 
         print(f"Iteration {iteration}: Score = {current_score:.3f}, Best = {best_score:.3f}")
 
@@ -203,19 +200,17 @@ def test_optimization():
     print("OPTIMIZATION RESULTS")
     print("=" * 50)
     print(f"Best score achieved: {best_score:.3f}")
+    best_params = _to_dict(best_params)
     print(f"Best parameters: {best_params}")
     print(f"Final learning rate: {learning_rate:.4f}")
 
     # Show improvement
-    initial_score = optimization_history[0]["score"]
+    initial_score = scores[0]
     improvement = initial_score - best_score
     print(f"Total improvement: {improvement:.3f}")
 
     # Convergence analysis
-    recent_scores = [h["score"] for h in optimization_history[-5:]]
-    score_variance = sum(
-        (s - sum(recent_scores) / len(recent_scores)) ** 2 for s in recent_scores
-    ) / len(recent_scores)
+    score_variance = scores[-5:].var()
     print(f"Recent score variance: {score_variance:.4f}")
 
     if score_variance < 0.1:
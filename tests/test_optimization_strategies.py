@@ -3,28 +3,26 @@
 Test script to demonstrate the different optimization strategies
 """
 
-import sys
-import os
-
-# Add the project root to the path so we can import from protocols
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from protocols.optimization_strategies import OptimizationStrategyFactory  # noqa: E402
+from protocols.optimization_strategies import (
+    HistoryRecord,
+    OptimizationStrategyFactory,
+    WellResult,
+)
+
+# Sample reference parameters shared by the tests
+REFERENCE_PARAMS = {
+    "aspiration_rate": 150.0,
+    "aspiration_delay": 1.0,
+    "aspiration_withdrawal_rate": 5.0,
+    "dispense_rate": 150.0,
+    "dispense_delay": 1.0,
+    "blowout_rate": 100.0,
+}
 
 
 def test_optimization_strategies():
     """Test all optimization strategies with sample data"""
 
-    # Sample reference parameters
-    reference_params = {
-        "aspiration_rate": 150.0,
-        "aspiration_delay": 1.0,
-        "aspiration_withdrawal_rate": 5.0,
-        "dispense_rate": 150.0,
-        "dispense_delay": 1.0,
-        "blowout_rate": 100.0,
-    }
-
     # Parameter bounds
     param_bounds = {
         "aspiration_rate": (10.0, 500.0),
@@ -40,17 +38,17 @@ def test_optimization_strategies():
 
     # Sample well data (simulating previous results)
     sample_well_data = [
-        {
-            "well_id": "A1",
-            "well_index": 0,
-            "parameters": reference_params.copy(),
-            "height_status": True,
-            "bubblicity_score": 2.5,
-        },
-        {
-            "well_id": "A2",
-            "well_index": 1,
-            "parameters": {
+        WellResult(
+            well_id="A1",
+            well_index=0,
+            parameters=REFERENCE_PARAMS.copy(),
+            height_status=True,
+            bubblicity_score=2.5,
+        ),
+        WellResult(
+            well_id="A2",
+            well_index=1,
+            parameters={
                 "aspiration_rate": 140.0,
                 "aspiration_delay": 1.1,
                 "aspiration_withdrawal_rate": 5.2,
@@ -58,9 +56,9 @@ def test_optimization_strategies():
                 "dispense_delay": 1.05,
                 "blowout_rate": 95.0,
             },
-            "height_status": True,
-            "bubblicity_score": 2.1,
-        },
+            height_status=True,
+            bubblicity_score=2.1,
+        ),
     ]
 
     # Test hybrid strategy with different sample counts
@@ -75,7 +73,7 @@ def test_optimization_strategies():
         try:
             # Create hybrid strategy with specific sample count
             strategy = OptimizationStrategyFactory.create_strategy(
-                "hybrid", reference_params, param_bounds, sample_count
+                "hybrid", REFERENCE_PARAMS, param_bounds, sample_count
             )
 
             print(f"Strategy: {strategy.get_strategy_name()}")
@@ -85,15 +83,17 @@ def test_optimization_strategies():
             phase_configs = getattr(strategy, "phase_configs", None)
             if phase_configs:
                 print("\nPhase Allocation:")
-                total_wells = 0
-                for phase_name, config in phase_configs.items():
-                    wells = config["wells_per_phase"]
-                    total_wells += wells
-                    percentage = (wells / sample_count) * 100
+                percent_per_well = 100.0 / sample_count
+                allocation = [
+                    (phase_name, config["wells_per_phase"], config["description"])
+                    for phase_name, config in phase_configs.items()
+                ]
+                for phase_name, wells, description in allocation:
                     print(
-                        f"  {phase_name:12}: {wells:2d} wells ({percentage:5.1f}%) - "
-                        f"{config['description']}"
+                        f"  {phase_name:12}: {wells:2d} wells "
+                        f"({wells * percent_per_well:5.1f}%) - {description}"
                     )
+                total_wells = sum(wells for _, wells, _ in allocation)
                 print(f"  {'Total':12}: {total_wells:2d} wells")
 
         except Exception as e:
@@ -113,7 +113,7 @@ def test_optimization_strategies():
         try:
             # Create strategy
             strategy = OptimizationStrategyFactory.create_strategy(
-                strategy_name, reference_params, param_bounds, 96
+                strategy_name, REFERENCE_PARAMS, param_bounds, 96
             )
 
             print(f"Strategy Name: {strategy.get_strategy_name()}")
@@ -185,5 +185,107 @@ def test_optimization_strategies():
     print("• Use COORDINATE for initial exploration or when computational budget is limited")
 
 
+def test_adaptive_learning_rate():
+    """Test that AdaGrad-style scaling normalizes the first gradient step"""
+    gradients = {param: 0.0 for param in REFERENCE_PARAMS}
+    gradients["aspiration_rate"] = -4.0
+
+    for strategy_name in ["simultaneous", "hybrid"]:
+        legacy = OptimizationStrategyFactory.create_strategy(
+            strategy_name, REFERENCE_PARAMS, {}, 96
+        )
+        adaptive = OptimizationStrategyFactory.create_strategy(
+            strategy_name, REFERENCE_PARAMS, {}, 96, adaptive_learning_rate=True
+        )
+
+        if strategy_name == "simultaneous":
+            legacy_params = legacy.update_parameters_with_gradient(REFERENCE_PARAMS, gradients, 0.1)
+            adaptive_params = adaptive.update_parameters_with_gradient(
+                REFERENCE_PARAMS, gradients, 0.1
+            )
+        else:
+            legacy_params = legacy.update_phase_parameters(
+                "flow_rates", REFERENCE_PARAMS, gradients, 0.1
+            )
+            adaptive_params = adaptive.update_phase_parameters(
+                "flow_rates", REFERENCE_PARAMS, gradients, 0.1
+            )
+
+        # Legacy: 0.1 * 10.0 * -4.0; adaptive: first step is learning_rate * step size
+        assert abs(legacy_params["aspiration_rate"] - 146.0) < 1e-9
+        assert abs(adaptive_params["aspiration_rate"] - 149.0) < 1e-6
+        assert adaptive_params["dispense_rate"] == 150.0
+
+
+def test_random_coordinate_selection():
+    """Test that seeded random coordinate selection is reproducible and not cyclic"""
+
+    def selected_indices(seed, random_selection=True):
+        strategy = OptimizationStrategyFactory.create_strategy(
+            "coordinate", REFERENCE_PARAMS, {}, random_selection=random_selection, seed=seed
+        )
+        indices = []
+        for well_idx in range(30):
+            strategy.record_result(well_idx, REFERENCE_PARAMS.copy(), 1.0, True, 0.1)
+            indices.append(strategy.current_param_index)
+        return indices
+
+    indices = selected_indices(42)
+    assert indices == selected_indices(42)
+    assert all(0 <= idx < 6 for idx in indices)
+    # Not the cyclic order, and a different seed gives a different order
+    assert indices != selected_indices(42, random_selection=False)
+    assert indices != selected_indices(7)
+
+    strategy = OptimizationStrategyFactory.create_strategy(
+        "coordinate", REFERENCE_PARAMS, {}, random_selection=True
+    )
+    assert "random order" in strategy.get_strategy_description()
+
+
+def test_dict_well_data():
+    """Test that strategies still accept previous well results as plain dicts"""
+    explored_params = {param: value * 1.1 for param, value in REFERENCE_PARAMS.items()}
+    # Only the keys the strategies read, plus an unrelated extra key
+    rows = [
+        {"parameters": REFERENCE_PARAMS, "bubblicity_score": 2.5, "timestamp": 0.0},
+        {"parameters": explored_params, "bubblicity_score": 2.1, "timestamp": 1.0},
+    ]
+    tuples = [
+        WellResult(
+            well_id="",
+            well_index=-1,
+            parameters=row["parameters"],
+            height_status=False,
+            bubblicity_score=row["bubblicity_score"],
+        )
+        for row in rows
+    ]
+
+    for strategy_name in OptimizationStrategyFactory.get_available_strategies():
+        from_dicts = OptimizationStrategyFactory.create_strategy(
+            strategy_name, REFERENCE_PARAMS, {}, 96
+        )
+        from_tuples = OptimizationStrategyFactory.create_strategy(
+            strategy_name, REFERENCE_PARAMS, {}, 96
+        )
+        for well_idx in range(5):
+            assert from_dicts.generate_parameters(
+                well_idx, rows, 0.1
+            ) == from_tuples.generate_parameters(well_idx, tuples, 0.1)
+
+
+def test_history_dicts():
+    """Test that the history property exposes recorded results as dicts"""
+    strategy = OptimizationStrategyFactory.create_strategy("coordinate", REFERENCE_PARAMS, {})
+    strategy.record_result(0, REFERENCE_PARAMS.copy(), 2.5, True, 0.1)
+    strategy.record_result(1, REFERENCE_PARAMS.copy(), 2.1, True, 0.1)
+
+    history = list(strategy.history)
+    assert [entry["score"] for entry in history] == [2.5, 2.1]
+    assert history[1]["best_score"] == 2.5
+    assert set(history[0]) == set(HistoryRecord._fields)
+
+
 if __name__ == "__main__":
     test_optimization_strategies()
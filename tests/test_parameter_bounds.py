@@ -3,13 +3,7 @@
 Test script to demonstrate improved parameter bounds for different pipette and liquid combinations
 """
 
-import sys
-import os
-
-# Add the project root to the path so we can import from protocols
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from protocols.optimization_strategies import OptimizationStrategy  # noqa: E402
+from protocols.optimization_strategies import OptimizationStrategy
 
 
 def test_parameter_bounds():
@@ -86,19 +80,17 @@ def test_parameter_bounds():
     print("Parameter          | Old Bounds        | New Bounds        | Improvement")
     print("-" * 75)
 
-    for param in old_bounds.keys():
-        old_min, old_max = old_bounds[param]
-        new_min, new_max = new_bounds[param]
-
-        # Calculate improvement
-        old_range = old_max - old_min
-        new_range = new_max - new_min
-        improvement = ((old_range - new_range) / old_range) * 100
-
-        print(
-            f"{param:18} | {old_min:6.1f} - {old_max:6.1f} | {new_min:6.1f} - "
-            f"{new_max:6.1f} | {improvement:+5.1f}%"
-        )
+    old_ranges = {param: high - low for param, (low, high) in old_bounds.items()}
+    new_ranges = {param: high - low for param, (low, high) in new_bounds.items()}
+
+    # Improvement is how much of the old range the new bounds cut away
+    rows = [
+        f"{param:18} | {old_min:6.1f} - {old_max:6.1f} | "
+        f"{new_bounds[param][0]:6.1f} - {new_bounds[param][1]:6.1f} | "
+        f"{(old_ranges[param] - new_ranges[param]) / old_ranges[param] * 100:+5.1f}%"
+        for param, (old_min, old_max) in old_bounds.items()
+    ]
+    print("\n".join(rows))
 
     print("\n" + "=" * 80)
     print("RECOMMENDATIONS:")
@@ -2,71 +2,77 @@
 Tests for the Liquid Class Calibration Protocol
 """
 
-import sys
-import os
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import Mock, create_autospec, patch
 from opentrons import protocol_api
 
-# Add the project root to the path so we can import from protocols
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 # Import the actual protocol module
-import protocols.single_channel as protocol  # noqa: E402
+import protocols.single_channel as protocol
+
+
+@pytest.fixture(scope="module")
+def _protocol_context_mock():
+    """Spec'd protocol context mock, built once so ProtocolContext is introspected once"""
+    return create_autospec(protocol_api.ProtocolContext, instance=True)
+
+
+@pytest.fixture
+def mock_protocol(_protocol_context_mock):
+    """Protocol context mock reset per test, so recorded calls never leak between tests"""
+    mock = _protocol_context_mock
+    mock.reset_mock()
+    mock.params = Mock()
+    mock.params.sample_count = 96
+    mock.params.pipette_mount = "right"
+    return mock
+
+
+@pytest.fixture
+def patched_run(monkeypatch):
+    """Replace the protocol's run function with a mock for the duration of a test"""
+    mock_run = Mock()
+    monkeypatch.setattr(protocol, "run", mock_run)
+    return mock_run
 
 
 class TestProtocol:
     """Test cases for the liquid class calibration protocol"""
 
-    def test_protocol_metadata(self):
+    @pytest.mark.parametrize("key", ["protocolName", "author", "description", "source"])
+    def test_protocol_metadata(self, key):
         """Test that protocol metadata is correctly defined"""
-        # Check metadata structure
-        assert hasattr(protocol, "metadata")
-        assert "protocolName" in protocol.metadata
-        assert "author" in protocol.metadata
-        assert "description" in protocol.metadata
-        assert "source" in protocol.metadata
-
-        # Check specific values
-        assert (
-            protocol.metadata["protocolName"]
-            == "Liquid Class Calibration with Pluggable Optimization"
-        )
-        assert protocol.metadata["author"] == "Roman Gurovich"
-
-    def test_requirements_structure(self):
+        assert key in protocol.metadata
+
+    @pytest.mark.parametrize(
+        "key,expected",
+        [
+            ("protocolName", "Liquid Class Calibration with Pluggable Optimization"),
+            ("author", "Roman Gurovich"),
+        ],
+    )
+    def test_metadata_values(self, key, expected):
+        """Test specific protocol metadata values"""
+        assert protocol.metadata[key] == expected
+
+    @pytest.mark.parametrize("key,expected", [("robotType", "Flex"), ("apiLevel", "2.22")])
+    def test_requirements_structure(self, key, expected):
         """Test that requirements are correctly defined"""
-        assert hasattr(protocol, "requirements")
-        assert "robotType" in protocol.requirements
-        assert "apiLevel" in protocol.requirements
+        assert protocol.requirements[key] == expected
 
-        # Check specific values
-        assert protocol.requirements["robotType"] == "Flex"
-        assert protocol.requirements["apiLevel"] == "2.22"
-
-    def test_parameter_definition(self):
+    def test_parameter_definition(self, mock_protocol):
         """Test that parameters are correctly defined"""
-        # Mock protocol context
-        mock_protocol = Mock(spec=protocol_api.ProtocolContext)
-        mock_params = Mock()
-        mock_protocol.params = mock_params
+        mock_params = mock_protocol.params
 
         # Test parameter addition
         with patch("protocols.single_channel.add_parameters") as mock_add_params:
             protocol.add_parameters(mock_params)
             mock_add_params.assert_called_once_with(mock_params)
 
-    @patch("protocols.single_channel.run")
-    def test_run_function_exists(self, mock_run):
+    def test_run_function_exists(self, patched_run, mock_protocol):
         """Test that the run function exists and can be called"""
-        # Mock protocol context
-        mock_protocol = Mock(spec=protocol_api.ProtocolContext)
-        mock_protocol.params.sample_count = 96
-        mock_protocol.params.pipette_mount = "right"
-
         # Test that run function can be called
         protocol.run(mock_protocol)
-        mock_run.assert_called_once_with(mock_protocol)
+        patched_run.assert_called_once_with(mock_protocol)
 
     def test_reference_parameters_structure(self):
         """Test that reference parameters have the expected structure"""